@@ -1,9 +1,10 @@
 """:class:`Context` provides a better representation for context."""
+import copy
 import functools
-import json
 
 import lena.core
 # import lena.flow
+from .functions import _ATOMIC_TYPES, to_string
 
 
 class Context(dict):
@@ -25,9 +26,25 @@ class Context(dict):
     def __init__(self, d=None, formatter=None):
         """Initialize from a dictionary *d* (empty by default).
 
+        As for a *dict*, only the top level of *d* is copied:
+        setting keys of a :class:`Context` doesn't change *d*,
+        while nested dictionaries are shared.
+
         Representation is defined by the *formatter*.
         That must be a callable accepting a dictionary
-        and returning a string. The default is ``json.dumps``.
+        and returning a string. The default is ``json.dumps``
+        (with sorted keys and indentation of 4 spaces).
+        The default representation is reused
+        while the contents of the context don't change.
+        If that is still slow for you, use a formatter
+        from a faster JSON library, for example::
+
+            def orjson_formatter(d):
+                return orjson.dumps(
+                    d, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+                ).decode()
+
+        (define it at the module level to pickle contexts).
 
         All public attributes of a :class:`Context`
         can be retrieved or set using dot notation
@@ -65,10 +82,17 @@ class Context(dict):
                 )
             self._formatter = formatter
         else:
+            # json is loaded only when needed
+            import json
             self._formatter = functools.partial(json.dumps,
                                                 sort_keys=True, indent=4)
             # same, but doesn't allow pickling
             # lambda s: json.dumps(s, sort_keys=True, indent=4)
+            # The default formatting depends only on the contents,
+            # so it can be reused while they don't change.
+            self._cache_repr = True
+        # (contents, representation)
+        self._repr_cache = (None, None)
         # formatter should be private,
         # otherwise it'll mess with other attributes
         # self._formatter = pprint.PrettyPrinter(indent=1)
@@ -84,11 +108,32 @@ class Context(dict):
         When a :class:`Context` is used as a sequence element,
         its initialization argument *d*
         has no effect on the produced values.
+        If the context is already a :class:`Context`,
+        the *value* is returned unchanged.
         """
         data, context = value
         # data, context = lena.flow.get_data_context(value)
+        if isinstance(context, Context):
+            return value
         return (data, Context(context))
 
+    def __deepcopy__(self, memo):
+        # strings, numbers and the formatter are shared
+        # (they are not changed), nested containers are deep copied
+        if getattr(self, "_cache_repr", False):
+            new = self.__class__()
+        else:
+            new = self.__class__(formatter=self._formatter)
+        # registered before the contents,
+        # so that shared references and cycles are kept
+        memo[id(self)] = new
+        for key, val in self.items():
+            if type(val) in _ATOMIC_TYPES:
+                new[key] = val
+            else:
+                new[key] = copy.deepcopy(val, memo)
+        return new
+
     def __getattr__(self, name):
         # we don't implement getting nested attributes,
         # because that would require creating proxy objects.
@@ -108,6 +153,14 @@ class Context(dict):
                 "{} missing".format(name)
             )
 
+    def __reduce__(self):
+        # only the contents and a custom formatter are pickled,
+        # not the default formatter or the cached representation
+        if getattr(self, "_cache_repr", False):
+            # the default formatter is used
+            return (self.__class__, (dict(self),))
+        return (self.__class__, (dict(self), self._formatter))
+
     def _repr_nested(self, base_indent="", indent=" "*4, el_separ=",\n"):
         # representation within a Lena Sequence.
         # Initialization arguments are not printed,
@@ -115,10 +168,28 @@ class Context(dict):
         return base_indent + "Context()"
 
     def __repr__(self):
-        return self._formatter(self)
+        # indented JSON is formatted in pure Python,
+        # while the terse one (used to check the contents) is made in C.
+        # Nested values can be changed without our knowledge,
+        # that is why the whole contents are checked.
+        if not getattr(self, "_cache_repr", False):
+            return self._formatter(self)
+        try:
+            contents = to_string(self)
+        except lena.core.LenaValueError:
+            # the formatter will raise a proper error
+            return self._formatter(self)
+        cached_contents, cached_repr = self._repr_cache
+        if contents != cached_contents:
+            cached_repr = self._formatter(self)
+            self._repr_cache = (contents, cached_repr)
+        return cached_repr
 
     def __setattr__(self, attr, value):
-        if attr in ["_formatter"]:
+        if attr == "_formatter":
+            # a custom formatter may depend on anything
+            super(Context, self).__setattr__("_cache_repr", False)
+        if attr in ["_formatter", "_cache_repr", "_repr_cache"]:
             # from https://stackoverflow.com/a/17020163/952234,
             # "How to use __setattr__ correctly,
             # avoiding infinite recursion"
@@ -1,5 +1,4 @@
-from lena.core import LenaKeyError
-from .functions import str_to_list, get_recursively
+from .functions import str_to_list
 # todo: fix imports.
 # import lena.flow.functions
 # from lena.flow import get_data_context
@@ -12,6 +11,7 @@ class DeleteContext():
 
         *key* can be a dot-separated string or a list
         of nested string keys.
+        An empty *key* removes the entire context.
 
         .. versionadded:: 0.6
         """
@@ -26,25 +26,30 @@ class DeleteContext():
         # empty key removes the entire context.
         # Therefore it is not default.
         self._keyl = keyl
+        # the path is split once here, not for each value
+        if keyl:
+            self._subcont_keys = tuple(keyl[:-1])
+            self._key = keyl[-1]
         # todo (if needed): add a kwarg raise_on_missing
         # (for now skipped).
 
     def __call__(self, value):
         """Remove *key* from the context part of *value*.
 
-        If the *value* contains no such key, it is ignored.
+        If the *value* contains no such key
+        (or its subcontext is not a dictionary), it is ignored.
         """
         # todo: improve imports. Remove circular ones.
         from lena.flow import get_data_context
         data, context = get_data_context(value)
-        subcont_key, key = self._keyl[:-1], self._keyl[-1]
-        try:
-            subcont = get_recursively(context, subcont_key)
-        except LenaKeyError:
+        if not self._keyl:
+            context.clear()
             return value
 
-        try:
-            del subcont[key]
-        except KeyError:
-            pass
+        subcont = context
+        for key in self._subcont_keys:
+            subcont = subcont.get(key)
+            if not isinstance(subcont, dict):
+                return value
+        subcont.pop(self._key, None)
         return value
@@ -1,7 +1,12 @@
 """Functions to work with context (dictionary)."""
 
 import copy
-from json import dumps
+import re
+try:
+    from sys import intern
+except ImportError:
+    # Python 2 has a built-in intern
+    pass
 
 import lena
 from lena.core import LenaTypeError, LenaValueError, LenaKeyError
@@ -10,6 +15,52 @@ from lena.core import LenaTypeError, LenaValueError, LenaKeyError
 # d is a good name for a dictionary,
 # used in Python documentation for dict.
 
+# dotted keys are few and repeated for each value,
+# so their splits are cached.
+_split_cache = {}
+_SPLIT_CACHE_SIZE = 4096
+
+
+def _split_dotted(s):
+    """Return a tuple of dot-separated parts of a string *s*.
+
+    Parts are interned, so that dictionaries created with them
+    and lookups with them compare keys by identity.
+    """
+    try:
+        return _split_cache[s]
+    except KeyError:
+        pass
+    if len(_split_cache) >= _SPLIT_CACHE_SIZE:
+        _split_cache.clear()
+    parts = _split_cache[s] = tuple(intern(part) for part in s.split("."))
+    return parts
+
+
+# types shared between copies of a context (they are immutable)
+_ATOMIC_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _fast_clone(obj):
+    """Copy containers of *obj*, sharing its immutable leaves.
+
+    For contexts that consist of dicts, lists and tuples
+    of strings and numbers this is equivalent to
+    :func:`copy.deepcopy`, but several times faster.
+    Other objects are copied with :func:`copy.deepcopy`.
+    """
+    # exact types: subclasses may have their own copy semantics
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _fast_clone(val) for key, val in obj.items()}
+    if obj_type in _ATOMIC_TYPES:
+        return obj
+    if obj_type is list:
+        return [_fast_clone(val) for val in obj]
+    if obj_type is tuple:
+        return tuple(_fast_clone(val) for val in obj)
+    return copy.deepcopy(obj)
+
 
 def contains(d, s):
     """Check that a dictionary *d* contains a subdictionary
@@ -31,33 +82,37 @@ def contains(d, s):
 
     If the most nested element of *d* to be compared with *s*
     is not a string, its string representation is used for comparison.
+    That representation is compared with the rest of *s*,
+    which may contain dots (like *"x.1.5"* for *{"x": 1.5}*).
     See also :func:`str_to_dict`.
     """
     # This function is used in string selectors.
     # todo: s can be a list, or a dict?
     # todo: should be rewritten through get_recursively or intersection
-    levels = s.split(".")
+    levels = _split_dotted(s)
     if len(levels) < 2:
         # todo: an empty string should return True.
         return s in d
     subdict = d
-    for key in levels[:-1]:
-        if key not in subdict:
+    for ind, key in enumerate(levels):
+        if not isinstance(subdict, dict):
+            # just a value. Its representation can contain dots,
+            # so it is compared with the rest of the string.
+            rest = ".".join(levels[ind:])
+            if type(subdict) in _ATOMIC_TYPES:
+                # strings and numbers can always be cast to str
+                return str(subdict) == rest
+            try:
+                # it's better to test for an object to be cast to str
+                # than to disallow "dim.1"
+                subd = str(subdict)
+            except Exception:
+                return False
+            return subd == rest
+        subdict = subdict.get(key, _sentinel)
+        if subdict is _sentinel:
             return False
-        subdict = subdict[key]
-    last_val = levels[-1]
-    if isinstance(subdict, dict):
-        return last_val in subdict
-    else:
-        # just a value
-        try:
-            # it's better to test for an object to be cast to str
-            # than to disallow "dim.1"
-            subd = str(subdict)
-        except Exception:
-            return False
-        else:
-            return subd == last_val
+    return True
 
 
 def difference(d1, d2, level=-1):
@@ -99,6 +154,15 @@ def difference(d1, d2, level=-1):
     return result
 
 
+# opening braces and the field name
+# until a conversion, a format specification or the end of the field
+_FORMAT_FIELD = re.compile(r"(\{+)([^}!:]*)")
+# formatters are stateless, so they are shared for same strings
+# (format_update_with creates them for every value)
+_formatters = {}
+_FORMATTERS_CACHE_SIZE = 256
+
+
 def format_context(format_str):
     """Create a function that formats a context using the given string.
 
@@ -138,6 +202,11 @@ def format_context(format_str):
         raise LenaTypeError(
             "format_str must be a string, {} given".format(format_str)
         )
+    try:
+        return _formatters[format_str]
+    except KeyError:
+        pass
+    init_format_str = format_str
 
     # prohibit single or unbalanced braces
     if format_str.count('{') != format_str.count('}'):
@@ -149,54 +218,43 @@ def format_context(format_str):
         )
 
     # new format: now double braces instead of single ones.
-    # but the algorithm may be left unchanged.
     format_str = format_str.replace("{{", "{").replace("}}", "}")
-    new_str = []
+    # replacement fields are removed from format_str in one pass
+    # (and formatted as positional arguments)
     new_args = []
-    prev_char = ''
-    ind = 0
-    within_field = False
-    while ind < len(format_str):
-        c = format_str[ind]
-        if c != '{' and not within_field:
-            prev_char = c
-            new_str.append(c)
-            ind += 1
-            continue
-        while c == '{' and ind < len(format_str):
-            new_str.append(c)
-            # literal formatting { are not allowed
-            # if prev_char == '{':
-            #     prev_char = ''
-            #     within_field = False
-            # else:
-            prev_char = c
-            within_field = True
-
-            ind += 1
-            c = format_str[ind]
-        if within_field:
-            new_arg = []
-            while ind < len(format_str):
-                if c in '}!:':
-                    prev_char = c
-                    within_field = False
-                    new_args.append(''.join(new_arg))
-                    break
-                new_arg.append(c)
-                ind += 1
-                c = format_str[ind]
-    format_str = ''.join(new_str)
-    args = new_args
-    def _format_context(context):
-        new_args = []
-        for arg in args:
+    def remove_field(match):
+        new_args.append(match.group(2))
+        return match.group(1)
+    format_str = _FORMAT_FIELD.sub(remove_field, format_str)
+    # dotted keys are split once here, not during each call
+    # (get_recursively uses tuples as they are)
+    args = [tuple(key for key in _split_dotted(arg) if key)
+            for arg in new_args]
+    # the string is parsed and joined in C during str.format,
+    # which is faster than joining separately formatted parts
+    format_ = format_str.format
+    formatted = None
+    if not args:
+        # the result doesn't depend on context
+        try:
+            formatted = format_()
+        except ValueError:
+            # raise during the call, as for other templates
+            pass
+    if formatted is not None:
+        def _format_context(context):
+            return formatted
+    else:
+        def _format_context(context):
             # LenaKeyError may be raised
-            new_args.append(lena.context.get_recursively(context, arg))
-        # other exceptions, like ValueError
-        # (for bad string formatting) may be raised.
-        s = format_str.format(*new_args)
-        return s
+            new_args = [get_recursively(context, arg) for arg in args]
+            # other exceptions, like ValueError
+            # (for bad string formatting) may be raised.
+            return format_(*new_args)
+
+    if len(_formatters) >= _FORMATTERS_CACHE_SIZE:
+        _formatters.clear()
+    _formatters[init_format_str] = _format_context
     return _format_context
 
 
@@ -233,7 +291,7 @@ _sentinel = object()
 def get_recursively(d, keys, default=_sentinel):
     """Get value from a dictionary *d* recursively.
 
-    *keys* can be a list of simple keys (strings),
+    *keys* can be a list or a tuple of simple keys (strings),
     a dot-separated string
     or a dictionary with at most one key at each level.
     A string is split by dots and used as a list.
@@ -244,6 +302,8 @@ def get_recursively(d, keys, default=_sentinel):
     otherwise :exc:`.LenaKeyError` is raised.
 
     If *keys* is empty, *d* is returned.
+    A tuple is used as it is, without checks of its elements,
+    which is useful for keys split in advance.
 
     Examples:
 
@@ -271,9 +331,14 @@ def get_recursively(d, keys, default=_sentinel):
         raise LenaTypeError(
             "need a dictionary, {} provided".format(d)
         )
-    if isinstance(keys, str):
+    if isinstance(keys, tuple):
+        # already split keys (the fast path)
+        pass
+    elif isinstance(keys, str):
         # here empty substrings are skipped, but this is undefined.
-        keys = [key for key in keys.split('.') if key]
+        keys = _split_dotted(keys)
+        if "" in keys:
+            keys = [key for key in keys if key]
     # todo: create dict_to_list and disable dict keys here?
     elif isinstance(keys, dict):
         new_keys = []
@@ -300,13 +365,18 @@ def get_recursively(d, keys, default=_sentinel):
             )
     else:
         raise LenaTypeError(
-            "keys must be a dict, a string or a list of keys, "
+            "keys must be a dict, a string, a list or a tuple of keys, "
             "{} given".format(keys)
         )
 
+    if not keys:
+        return d
+
+    # one dictionary lookup per level
     for key in keys[:-1]:
-        if key in d and isinstance(d.get(key), dict):
-            d = d[key]
+        subd = d.get(key)
+        if isinstance(subd, dict):
+            d = subd
         elif has_default:
             return default
         else:
@@ -314,10 +384,10 @@ def get_recursively(d, keys, default=_sentinel):
                 "nested dict {} not found in {}".format(key, d)
             )
 
-    if not keys:
-        return d
-    if keys[-1] in d:
-        return d[keys[-1]]
+    # dict.get doesn't call __missing__ for dict subclasses
+    val = d.get(keys[-1], _sentinel)
+    if val is not _sentinel:
+        return val
     elif has_default:
         return default
     else:
@@ -378,31 +448,44 @@ def intersection(*dicts, **kwargs):
 
     if not dicts:
         return {}
-    res = copy.deepcopy(dicts[0])
+    d0 = dicts[0]
+    res = d0
     for d in dicts[1:]:
+        if d is res:
+            # intersection with self changes nothing
+            continue
         if level == 0:
             if d == res and d:
                 continue
             else:
                 return {}
-        to_delete = []
-        for key in res:
-            if key in d:
-                if d[key] != res[key]:
-                    if level == 1:
-                        to_delete.append(key)
-                    elif isinstance(res[key], dict) and isinstance(d[key], dict):
-                        res[key] = intersection(res[key], d[key], level=level-1)
-                    else:
-                        to_delete.append(key)
-            else:
-                # keys can't be deleted during iteration
-                to_delete.append(key)
-        for key in to_delete:
-            del res[key]
+        res = _intersect_dicts(res, d, level)
         if not res:
             # res was calculated empty
             return res
+    # only the values that remained are copied
+    return copy.deepcopy(res)
+
+
+def _intersect_dicts(d1, d2, level):
+    # intersection of two dictionaries without copies of values.
+    # The result has the type and the values of d1
+    if type(d1) is dict:
+        res = {}
+    else:
+        res = copy.copy(d1)
+        res.clear()
+    # iterate the smaller dictionary
+    keys = d2 if len(d2) < len(d1) else d1
+    for key in keys:
+        if key not in d1 or key not in d2:
+            continue
+        val, other = d1[key], d2[key]
+        if val == other:
+            res[key] = val
+        elif (level != 1 and isinstance(val, dict)
+              and isinstance(other, dict)):
+            res[key] = _intersect_dicts(val, other, level - 1)
     return res
 
 
@@ -440,7 +523,7 @@ def str_to_dict(s, value=_sentinel):
     # probably this is a bad design,
     # elif isinstance(s, dict):
     #     return s
-    parts = s.split(".")
+    parts = list(_split_dotted(s))
     if value is not _sentinel:
         parts.append(value)
     def nest_list(d, l):
@@ -480,7 +563,22 @@ def str_to_list(s):
     # Another variant would be to treat empty strings
     # as whole context. The variant with '' seems more understandable
     # to the user.
-    return s.split(".")
+    # a new list is returned, since it can be changed by the caller
+    return list(_split_dotted(s))
+
+
+# json.dumps with non-default arguments creates an encoder for every call.
+# The encoder (and json) is loaded on the first use
+_to_string_encoder = None
+
+
+def _make_to_string_encoder():
+    global _to_string_encoder
+    from json import JSONEncoder
+    _to_string_encoder = JSONEncoder(
+        skipkeys=False, separators=(',', ':'), sort_keys=True
+    )
+    return _to_string_encoder
 
 
 def to_string(d):
@@ -511,7 +609,8 @@ def to_string(d):
     # keys should be sorted, because we want dictionary representations
     # to be invariant with respect to key order.
     try:
-        s = dumps(d, skipkeys=False, separators=(',', ':'), sort_keys=True)
+        encoder = _to_string_encoder or _make_to_string_encoder()
+        s = encoder.encode(d)
     except (TypeError, OverflowError, ValueError) as e:
         # JSON serialization errors.
         # A ValueError can raise from floats like inf or nan.
@@ -565,23 +664,22 @@ def update_nested(key, d, other):
     # (like {"split_into_bins": {"variable": {}, "histogram": {}}})
     # 2) elements change only one key ("variable", "histogram",...).
 
-    def get_most_nested_subdict_with(key, d):
-        nested_dicts = []
-        while True:
-            if key in d:
-                if d in nested_dicts:
-                    raise LenaValueError(
-                        "recursive *other* is forbidden"
-                    )
-                nested_dicts.append(d)
-                d = d[key]
-            else:
-                return d
-
-    if key in d:
-        other_most_nested = get_most_nested_subdict_with(key, other)
+    # one lookup in d
+    d_key = d.get(key, _sentinel)
+    if d_key is not _sentinel:
         # insert d[key] at the lowest other.key.key....
-        other_most_nested[key] = d[key]
+        # Identities are checked instead of equality of dicts,
+        # which could be deep and slow
+        nested_ids = set()
+        most_nested = other
+        while key in most_nested:
+            if id(most_nested) in nested_ids:
+                raise LenaValueError(
+                    "recursive *other* is forbidden"
+                )
+            nested_ids.add(id(most_nested))
+            most_nested = most_nested[key]
+        most_nested[key] = d_key
 
     d[key] = other
 
@@ -629,13 +727,24 @@ def update_recursively(d, other, value=_sentinel):
         raise LenaTypeError(
             "d and other must be dicts, {} and {} provided".format(d, other)
         )
-    for key, val in other.items():
-        if not isinstance(val, dict):
-            d[key] = val
-        else:
-            if key in d:
-                if not isinstance(d[key], dict):
-                    d[key] = {}
-                update_recursively(d[key], other[key])
-            else:
+    _update_dicts(d, other)
+
+
+def _update_dicts(d, other):
+    # update_recursively for dictionaries without argument checks.
+    # Nested dictionaries are merged in a loop, without recursion
+    pairs = [(d, other)]
+    while pairs:
+        d, other = pairs.pop()
+        for key, val in other.items():
+            if not isinstance(val, dict):
                 d[key] = val
+                continue
+            # one lookup instead of 'in' and indexing
+            subd = d.get(key, _sentinel)
+            if subd is _sentinel:
+                d[key] = val
+            else:
+                if not isinstance(subd, dict):
+                    subd = d[key] = {}
+                pairs.append((subd, val))
@@ -1,4 +1,13 @@
-from lena.core import LenaValueError
+import collections
+
+from lena.core import LenaTypeError, LenaValueError
+from .functions import str_to_list
+
+try:
+    # Python 2 keys can be unicode
+    _string_types = basestring
+except NameError:
+    _string_types = str
 
 
 def _group_by_starting_prefixes(keys):
@@ -13,13 +22,13 @@ def _group_by_starting_prefixes(keys):
     """
     # every key returned by _split_key is non-empty.
     assert all(key for key in keys)
-    start_prefixes = set(key[0] for key in keys)
 
-    gbsp = {sp: [] for sp in start_prefixes}
+    # one pass over keys
+    gbsp = collections.defaultdict(list)
     for key in keys:
         gbsp[key[0]].append(key[1:])
 
-    return gbsp
+    return dict(gbsp)
 
 
 def _split_key(key):
@@ -29,13 +38,15 @@ def _split_key(key):
     empty ones are not allowed (examples of improper subkeys are
     "a..b" or ".a"). Improper subkeys raise :exc:`.LenaValueError`.
     """
-    # todo: what is the difference with str_to_list?
-    # Probably only error checks.
+    # the difference with str_to_list is only in error checks
+    # (and the empty key).
     if key == "":
         # return a list since split returns a list
         return [key]
 
-    skey = key.split('.')
+    # a dot-split string is cached, and "in" is a C-level pass.
+    # A character loop in Python would be slower
+    skey = str_to_list(key)
     if "" in skey:
         raise LenaValueError(
             "Improper subkey found in '{}'.\n".format(key) +
@@ -79,6 +90,10 @@ class IncludeExcludeTree():
         self.keys = keys
         self.subtrees = subtrees
         self.include = bool(include)
+        # keys can be any container, but a set is searched faster
+        # (and a frozen one can be hashed)
+        self._keyset = frozenset(keys)
+        self._hash = None
 
         # to be done.
         # For now nested substrings of the same type are checked
@@ -101,30 +116,26 @@ class IncludeExcludeTree():
         Corresponds (is dual) to *dict.get(key)*.
         """
         result = {}
-        if self.include:
-            # by default include
-            exclude = self.keys
+        # subtrees are traversed in a loop, without recursion
+        stack = [(self, context, result)]
+        while stack:
+            tree, context, subresult = stack.pop()
+            keys = tree._keyset
+            subtrees = tree.subtrees
+            # explicit keys are excluded by default inclusion
+            # and included otherwise
+            include = tree.include
             for key, value in context.items():
-                if key in exclude:
-                    continue
-                elif key in self.subtrees:
+                if key in keys:
+                    if not include:
+                        subresult[key] = value
+                elif key in subtrees:
                     if isinstance(value, dict):
                         # otherwise it won't be selected anyway
-                        result[key] = self.subtrees[key].get(value)
-                else:
-                    result[key] = value
-        else:
-            # by default exclude
-            include = self.keys
-            for key, value in context.items():
-                if key in include:
-                    result[key] = value
-                elif key in self.subtrees:
-                    if isinstance(value, dict):
-                        # otherwise it won't be selected
-                        result[key] = self.subtrees[key].get(value)
-                else:
-                    continue
+                        subsubresult = subresult[key] = {}
+                        stack.append((subtrees[key], value, subsubresult))
+                elif include:
+                    subresult[key] = value
 
         return result
 
@@ -134,6 +145,13 @@ class IncludeExcludeTree():
         return (self.keys == other.keys and self.subtrees == other.subtrees and
                 self.include == other.include)
 
+    def __hash__(self):
+        # the hash is valid while the tree is not changed
+        if self._hash is None:
+            self._hash = hash((self._keyset, frozenset(self.subtrees.items()),
+                               self.include))
+        return self._hash
+
     def __repr__(self):
         return "IncludeExcludeTree(keys={}, subtrees={}, include={})"\
                 .format(self.keys, self.subtrees, self.include)
@@ -204,13 +222,42 @@ def _make_include_exclude_tree(includes, excludes, is_default_include):
     )
 
 
+def _copy_tree(tree):
+    """Return a copy of *tree* with new keys and subtrees."""
+    subtrees = dict((key, _copy_tree(subtree))
+                    for key, subtree in tree.subtrees.items())
+    return IncludeExcludeTree(
+        keys=set(tree.keys), subtrees=subtrees, include=tree.include
+    )
+
+
+# trees for seen selectors. Trees can be changed by their users,
+# so only their copies are returned
+_trees = {}
+_TREES_CACHE_SIZE = 128
+
+
 def make_include_exclude_tree(includes=tuple(), excludes=tuple()):
 
     # make arguments tuples for generality
     if isinstance(includes, str):
         includes = (includes,)
+    else:
+        includes = tuple(includes)
     if isinstance(excludes, str):
         excludes = (excludes,)
+    else:
+        excludes = tuple(excludes)
+    for key in includes + excludes:
+        if not isinstance(key, _string_types):
+            raise LenaTypeError(
+                "include and exclude keys must be strings, "
+                "{} given".format(key)
+            )
+    try:
+        return _copy_tree(_trees[(includes, excludes)])
+    except KeyError:
+        pass
 
     is_default_include = "" in includes
     if is_default_include + ("" in excludes) != 1:
@@ -225,4 +272,7 @@ def make_include_exclude_tree(includes=tuple(), excludes=tuple()):
     iet = _make_include_exclude_tree(
         includes=sincs, excludes=sexcs, is_default_include=is_default_include
     )
+    if len(_trees) >= _TREES_CACHE_SIZE:
+        _trees.clear()
+    _trees[(includes, excludes)] = _copy_tree(iet)
     return iet
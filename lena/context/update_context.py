@@ -1,14 +1,39 @@
 # requires jinja2
-import copy
 import re
 
 import lena.core
 import lena.context
+from lena.context.functions import _fast_clone, _split_dotted
 # import lena.flow
 
 
 _sentinel = object()
 
+# {{at least one symbol in between, no { or } in between}}
+_CONTEXT_VALUE = re.compile('{{[^{}]+}}$')
+
+# compiled templates don't change, so they are shared
+_templates = {}
+_TEMPLATES_CACHE_SIZE = 256
+
+
+def _get_template(update, undefined):
+    """Return a jinja2 template for a string *update*.
+
+    Templates are compiled only once for the same arguments.
+    """
+    import jinja2
+    key = (update, undefined)
+    try:
+        return _templates[key]
+    except KeyError:
+        pass
+    template = jinja2.Template(update, undefined=undefined)
+    if len(_templates) >= _TEMPLATES_CACHE_SIZE:
+        _templates.clear()
+    _templates[key] = template
+    return template
+
 
 class UpdateContext():
     """Update context of passing values."""
@@ -125,11 +150,15 @@ class UpdateContext():
                     "for simple update skip_on_missing, default "
                     "and raise_on_missing must not be set"
                 )
-        elif value and re.match('{{[^{}]+}}$', update):
+        elif value and _CONTEXT_VALUE.match(update):
             # context value update
-            # {{at least one symbol in between, no { or } in between}}
             self._context_value = True
             self._update = update[2:-2]
+            # split once, not for every value
+            # (and dotted strings are split only once at all)
+            self._update_keys = tuple(
+                key for key in _split_dotted(self._update) if key
+            )
             if not self._has_default and not self._skip_on_missing:
                 self._raise_on_missing = True
         else:
@@ -146,14 +175,14 @@ class UpdateContext():
                 )
             try:
                 if raise_on_missing or skip_on_missing:
-                    self._update = jinja2.Template(
-                        update, undefined=jinja2.StrictUndefined
+                    self._update = _get_template(
+                        update, jinja2.StrictUndefined
                     )
                 else:
                     # ChainableUndefined appeared in jinja2 2.11.0
                     if '{' in update:
-                        self._update = jinja2.Template(
-                            update, undefined=jinja2.ChainableUndefined
+                        self._update = _get_template(
+                            update, jinja2.ChainableUndefined
                         )
                     else:
                         self._update = update
@@ -183,8 +212,9 @@ class UpdateContext():
             if self._context_value:
                 if not self._has_default:
                     try:
-                        update = lena.context.get_recursively(context,
-                                                              self._update)
+                        update = lena.context.get_recursively(
+                            context, self._update_keys
+                        )
                     except lena.core.LenaKeyError as err:
                         if self._skip_on_missing:
                             return value
@@ -193,11 +223,11 @@ class UpdateContext():
                             raise err
                 else:
                     update = lena.context.get_recursively(
-                        context, self._update, self._default
+                        context, self._update_keys, self._default
                     )
                     assert not self._raise_on_missing
                     assert not self._skip_on_missing
-                update = copy.deepcopy(update)
+                update = _fast_clone(update)
             else:
                 # context format update
                 try:
@@ -215,7 +245,9 @@ class UpdateContext():
                         assert self._skip_on_missing
                         return value
         else:
-            update = copy.deepcopy(self._update)
+            # the update must not be shared between contexts,
+            # but strings and numbers need no copies
+            update = _fast_clone(self._update)
         # now empty context is prohibited.
         # May be skipped in runtime in the future.
         assert self._subcontext
@@ -401,10 +401,12 @@ class FillRequest(object):
                 self._buffer_in.append(value)
                 return
             else:
-                # add output to the output buffer
-                self._buffer_out.extend(self.request())
-                # don't reset because need to know that fill was called
-                # self._n_count = 0
+                # add output to the output buffer.
+                # self.request() would also yield that buffer
+                self._buffer_out.extend(self._el_request())
+                if self._reset:
+                    self._el_reset()
+                self._n_count = 0
 
         self._el_fill(value)
         self._n_count += 1
@@ -415,6 +417,14 @@ class FillRequest(object):
         If input or output buffers were filled, all their contents
         are processed and yielded.
         """
+        if not self._buffer_input:
+            # results buffered during fill precede the current ones
+            buffer_out = self._buffer_out
+            for val in buffer_out:
+                yield val
+            # the same buffer is used for the next requests
+            del buffer_out[:]
+
         # yield what was filled into the element
         if self._n_count >= self.bufsize:
             for val in self._el_request():
@@ -429,9 +439,7 @@ class FillRequest(object):
         # Buffers are always filled after the element,
         # therefore the order is correct.
         if not self._buffer_input:
-            # all results are in _buffer_out
-            for val in self._buffer_out:
-                yield val
+            # buffered results were already yielded
             if self._yield_on_remainder:
                 for val in self._el_request():
                     yield val
@@ -492,10 +500,14 @@ class FillRequest(object):
         raise exceptions.LenaNotImplementedError
 
     def _run_fill_compute(self, flow):
+        # methods and attributes are looked up once, not for every value
+        el_fill = self._el_fill
+        bufsize = self.bufsize
+        islice = itertools.islice
         while True:
             # A slice is a non-materialized list, which means
             # that it will not take place of *bufsize* in memory.
-            slice_ = itertools.islice(flow, self.bufsize)
+            slice_ = islice(flow, bufsize)
             # Reset the counter; what if it grows too large?
             # Maybe it will allow faster nfills % bufsize?
             # May be irrelevant though.
@@ -510,16 +522,16 @@ class FillRequest(object):
                 # if the flow was smaller than the required bufsize
                 break
             else:
-                self._el_fill(val)
+                el_fill(val)
                 nfills += 1
 
             for val in slice_:
-                self._el_fill(val)
+                el_fill(val)
                 nfills += 1
 
             # Flow finished too early.
             # Normally nfills would be equal to self.bufsize
-            if nfills % self.bufsize:
+            if nfills % bufsize:
                 if self._yield_on_remainder:
                     # can't return smth in Python 2 generator.
                     # return self.request()
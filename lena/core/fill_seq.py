@@ -14,10 +14,32 @@ class _Fill(object):
         """
         self._fill_into_el = fill_into_el
         self._fill_el = fill_el
+        # bound once, not for every value
+        self._fill_into = fill_into_el.fill_into
 
     def fill(self, value):
         """Transform *value* in *fill_into_el* and fill *fill_el*."""
-        self._fill_into_el.fill_into(self._fill_el, value)
+        self._fill_into(self._fill_el, value)
+
+
+class _FillCall(object):
+    """Implement a chained *fill(value)* method for a callable."""
+
+    def __init__(self, func, fill_el):
+        """*func* transforms a value, which fills *fill_el*."""
+        # one Python call per value instead of
+        # FillInto.fill_into and a chained fill.
+        # fill_el.fill is looked up during each call,
+        # since it may be changed after initialization
+        def fill(value):
+            fill_el.fill(func(value))
+        self.fill = fill
+
+
+def _is_call_fill_into(el):
+    # a FillInto adapter with its default fill_into for a callable
+    return (type(el) is adapters.FillInto
+            and "fill_into" not in vars(el))
 
 
 class FillSeq(LenaSequence):
@@ -74,10 +96,13 @@ class FillSeq(LenaSequence):
                 else:
                     seq.append(fill_into_el)
         seq.append(last)
-        # transform FillInto elements into _Fill
+        # transform FillInto elements into _Fill or _FillCall
         fill_el = last
         for el in reversed(seq[:-1]):
-            fill_el = _Fill(el, fill_el)
+            if _is_call_fill_into(el):
+                fill_el = _FillCall(el._el, fill_el)
+            else:
+                fill_el = _Fill(el, fill_el)
         # note that self._data_seq consists of original FillInto elements.
         self._fill_el = fill_el
         # self for these methods is different
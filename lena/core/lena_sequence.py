@@ -12,6 +12,10 @@ class LenaSequence(object):
     *LenaSequence* provides methods to iterate over a sequence,
     get its length and get an item at the given index.
     """
+    # subclasses without __slots__ still get a __dict__
+    __slots__ = ("_seq", "_data_seq", "_name",
+                 "_static_context", "_exc", "__weakref__")
+
     def __init__(self, *args):
         self._seq = args
         data_seq  = []
@@ -49,16 +53,14 @@ class LenaSequence(object):
 
     def _repr_nested(self, base_indent="", indent=" "*4, el_separ=",\n"):
         # to get a one-line representation, use el_separ=", ", indent=""
-
-        def repr_maybe_nested(el, base_indent, indent):
-            if hasattr(el, "_repr_nested"):
-                return el._repr_nested(base_indent=base_indent+indent, indent=indent)
-            else:
-                return base_indent + indent + repr(el)
-
-        elems = el_separ.join((repr_maybe_nested(el, base_indent=base_indent,
-                                                 indent=indent)
-                               for el in self._seq))
+        # Not cached: elements can change their representations
+        # (for example, Count shows its current count).
+        el_indent = base_indent + indent
+        elems = el_separ.join([
+            el._repr_nested(base_indent=el_indent, indent=indent)
+            if hasattr(el, "_repr_nested") else el_indent + repr(el)
+            for el in self._seq
+        ])
 
         if "\n" in el_separ and self._seq:
             # maybe new line
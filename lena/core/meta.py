@@ -34,12 +34,18 @@ def flatten(seq):
     if not isinstance(seq, (lena_sequence.LenaSequence, tuple)):
         # seq is an element
         return seq
-    for el in seq:
-        if isinstance(el, lena_sequence.LenaSequence):
-            flattened.extend(flatten(el))
-            flat = False
-        else:
+    # iterators over the sequences being flattened,
+    # without recursion for nested sequences
+    stack = [iter(seq)]
+    while stack:
+        for el in stack[-1]:
+            if isinstance(el, lena_sequence.LenaSequence):
+                stack.append(iter(el))
+                flat = False
+                break
             flattened.append(el)
+        else:
+            stack.pop()
 
     if flat:
         # return unchanged
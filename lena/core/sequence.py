@@ -1,5 +1,7 @@
 """Sequence class."""
+import inspect
 import sys
+import types
 
 from .lena_sequence import LenaSequence
 from . import adapters
@@ -7,6 +9,27 @@ from . import exceptions
 from . import functions
 
 
+def _identity(value):
+    return value
+
+
+def _is_identity(el):
+    """Return ``True`` if *el* is a function
+    that returns its only argument, like ``lambda val: val``.
+    """
+    if type(el) is not types.FunctionType:
+        # methods and other callables may do more
+        return False
+    code = el.__code__
+    id_code = _identity.__code__
+    return (code.co_code == id_code.co_code
+            and code.co_argcount == 1
+            and not getattr(code, "co_kwonlyargcount", 0)
+            and not code.co_flags & (inspect.CO_VARARGS
+                                     | inspect.CO_VARKEYWORDS
+                                     | inspect.CO_GENERATOR))
+
+
 class Sequence(LenaSequence):
     """Sequence of elements, such that next takes input
     from the previous during *run*.
@@ -15,6 +38,8 @@ class Sequence(LenaSequence):
     For sequence with no input data use :class:`Source`.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args):
         """*args* are objects
         which implement a method *run(flow)* or callables.
@@ -36,6 +61,9 @@ class Sequence(LenaSequence):
         # todo: we could change self._seq in place,
         # check performance (replacement + index access)
         for el in self._data_seq:
+            if _is_identity(el):
+                # it would only add a call for each value
+                continue
             if hasattr(el, "run") and callable(el.run):
                 seq.append(el)
             else:
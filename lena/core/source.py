@@ -2,18 +2,75 @@
 
 from __future__ import print_function
 
+import numbers
+import threading
 import warnings
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
 
 from .lena_sequence import LenaSequence
 from .sequence import Sequence
-from .exceptions import LenaTypeError
+from .exceptions import LenaTypeError, LenaValueError
 from .functions import flow_to_iter
 
 
+def _prefetch(flow, size):
+    """Yield values of *flow* read in advance in a separate thread.
+
+    At most *size* values are stored.
+    Exceptions from *flow* are raised in the calling thread.
+    """
+    values = queue.Queue(size)
+    stop = threading.Event()
+
+    def put(item):
+        # don't block forever if the values are no longer consumed
+        while not stop.is_set():
+            try:
+                values.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def read():
+        try:
+            for val in flow:
+                if not put((True, val)):
+                    return
+        except BaseException as err:
+            # any error must reach the consumer,
+            # otherwise it would wait forever
+            put((False, err))
+        else:
+            put((False, None))
+
+    reader = threading.Thread(target=read)
+    reader.daemon = True
+    reader.start()
+    try:
+        while True:
+            is_value, val = values.get()
+            if is_value:
+                yield val
+            elif val is None:
+                return
+            else:
+                raise val
+    finally:
+        # the flow was exhausted or closed
+        stop.set()
+
+
 class Source(LenaSequence):
     """Sequence with no input flow."""
 
-    def __init__(self, *args):
+    __slots__ = ("_prefetch", "_first", "_tail")
+
+    def __init__(self, *args, **kwargs):
         """First argument is the initial element with no input flow.
         It can be an an object with a generator function `__call__()`
         or an iterable.
@@ -27,11 +84,41 @@ class Source(LenaSequence):
 
         For a *sequence* that transforms the incoming flow
         use :class:`Sequence`.
+
+        If a keyword argument *prefetch* is a positive number,
+        the flow of the first element is read in a separate thread,
+        at most *prefetch* values in advance. This can help
+        if the first element waits for input (like reading files),
+        while the following elements compute.
+        The first element must not share its values
+        with the following elements (for example, by changing
+        a yielded object in place).
+        By default (for zero) the flow is read in the same thread.
+        A negative *prefetch* raises :exc:`.LenaValueError`,
+        a non-integer one raises :exc:`.LenaTypeError`
+        (as do unknown keyword arguments).
         """
         if not args:
             raise LenaTypeError(
                 "Source must be initialized with 1 argument or more (0 given)"
             )
+        # Python 2 has no keyword-only arguments
+        prefetch = kwargs.pop("prefetch", 0)
+        if kwargs:
+            raise LenaTypeError(
+                "unknown keyword arguments {}".format(kwargs)
+            )
+        # bool is a subclass of int, but is most probably an error
+        if (not isinstance(prefetch, numbers.Integral)
+                or isinstance(prefetch, bool)):
+            raise LenaTypeError(
+                "prefetch must be an integer, {} given".format(prefetch)
+            )
+        if prefetch < 0:
+            raise LenaValueError(
+                "prefetch must be non-negative, {} given".format(prefetch)
+            )
+        self._prefetch = int(prefetch)
 
         self._name = "Source"  # for repr
         super(Source, self).__init__(*args)
@@ -71,6 +158,8 @@ class Source(LenaSequence):
         elif hasattr(first, "__iter__"):
             # iterable
             flow = first
+        if self._prefetch:
+            flow = _prefetch(flow, self._prefetch)
         if self._tail:
             return self._tail.run(flow)
         else:
@@ -79,4 +168,5 @@ class Source(LenaSequence):
     def __eq__(self, other):
         if not isinstance(other, Source):
             return NotImplemented
-        return self._seq == other._seq
+        return (self._seq == other._seq
+                and self._prefetch == other._prefetch)
@@ -1,7 +1,7 @@
 """Split data flow and run analysis in parallel."""
 import collections
-import copy
 import itertools
+import threading
 from copy import deepcopy
 
 import lena.context
@@ -69,11 +69,60 @@ def _get_seq_with_type(seq, bufsize=None):
     return (seq, seq_type)
 
 
+def _fill_buf(seq, buf):
+    """Fill *seq* with values from *buf*.
+
+    Return ``True`` if the filling was stopped
+    with :exc:`.LenaStopFill`.
+    """
+    # fill is looked up once per buffer
+    fill = seq.fill
+    try:
+        for val in buf:
+            fill(val)
+    except exceptions.LenaStopFill:
+        return True
+    return False
+
+
+def _fill_bufs_in_threads(seqs_bufs):
+    """Fill each sequence with its buffer in a separate thread.
+
+    *seqs_bufs* is a list of pairs *(seq, buf)*.
+    Return a list with results of :func:`_fill_buf`.
+    The first exception from a thread
+    (including *SystemExit* and other *BaseException*)
+    is raised here.
+    """
+    results = [None] * len(seqs_bufs)
+    errors = []
+
+    def fill(ind, seq, buf):
+        try:
+            results[ind] = _fill_buf(seq, buf)
+        except BaseException as err:
+            # otherwise the thread would die silently
+            errors.append(err)
+
+    threads = [threading.Thread(target=fill, args=(ind, seq, buf))
+               for ind, (seq, buf) in enumerate(seqs_bufs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
 class LenaSplit(object):
     """Abstract base class for split sequences."""
 
     def __init__(self, seqs):
         self._seqs = seqs
+        # intersection of static contexts of seqs,
+        # computed on demand and reset in _set_context
+        self._static_context = None
         # copied from LenaSequence
         try:
             self._set_context({})
@@ -106,6 +155,8 @@ class LenaSplit(object):
                         "([", mnl, elems, mnl, mbi, "])"])
 
     def _get_context(self):
+        if self._static_context is not None:
+            return deepcopy(self._static_context)
         contexts = []
         for seq in self._seqs:
             # if a sequence has no context at all,
@@ -116,17 +167,17 @@ class LenaSplit(object):
                 # this will raise a LenaKeyError.
                 contexts.append(seq._get_context())
 
-        # we don't store the static context of Split,
-        # because that is already stored in an external sequence.
+        # static contexts of seqs change only in _set_context,
+        # so the intersection is stored until then.
         context = lena.context.intersection(*contexts)
-        # deep copy is already done in the intersection.
-        # return deepcopy(context)
-        return context
+        self._static_context = context
+        return deepcopy(context)
 
     def _set_context(self, context):
         if not context:
             # every sequence was already initialised with {}.
             return
+        self._static_context = None
         for seq in self._seqs:
             if hasattr(seq, "_set_context"):
                 # can raise LenaKeyError if some context
@@ -147,7 +198,7 @@ class LenaSplit(object):
 class Split(LenaSplit):
     """Split data flow and run analysis in parallel."""
 
-    def __init__(self, seqs, bufsize=1000, copy_buf=True):
+    def __init__(self, seqs, bufsize=1000, copy_buf=True, parallel=False):
         """*seqs* must be a list of Sequence, Source, FillComputeSeq
         or FillRequestSeq sequences.
         If *seqs* is empty, *Split* acts as an empty *Sequence* and
@@ -163,6 +214,13 @@ class Split(LenaSplit):
         This is important if different sequences can change input data
         and thus interfere with each other.
 
+        If *parallel* is ``True``, *FillComputeSeq* and *FillRequestSeq*
+        sequences are filled with each buffer in separate threads
+        during :meth:`run`. This can help if their elements
+        wait for input or output, or release the GIL.
+        These sequences must not share elements or other state.
+        Results are yielded in the same order as without threads.
+
         Common type:
             If each sequence from *seqs* has a common type,
             *Split* creates methods corresponding to this type.
@@ -218,6 +276,7 @@ class Split(LenaSplit):
             self.run = self._empty_run
 
         self._copy_buf = bool(copy_buf)
+        self._parallel = bool(parallel)
 
         if bufsize is not None:
             if bufsize != int(bufsize) or bufsize < 1:
@@ -251,7 +310,7 @@ class Split(LenaSplit):
     def _fill(self, val):
         for seq in self._seqs[:-1]:
             if self._copy_buf:
-                seq.fill(copy.deepcopy(val))
+                seq.fill(deepcopy(val))
             else:
                 seq.fill(val)
         self._seqs[-1].fill(val)
@@ -322,14 +381,36 @@ class Split(LenaSplit):
             else:
                 break
 
+            def get_buf(ind, n_of_seqs=n_of_active_seqs):
+                # *ind* is the index of a sequence before this buffer
+                if self._copy_buf and n_of_seqs - ind > 1:
+                    # last sequence doesn't need a copy of the buffer.
+                    # Values are arbitrary user data
+                    # (possibly with shared references or cycles),
+                    # so only deepcopy is safe here
+                    return deepcopy(orig_buf)
+                return orig_buf
+
+            # whether fill sequences were stopped,
+            # by their indices before this buffer
+            stopped_fills = {}
+            if self._parallel:
+                fill_inds = [
+                    ind for ind, seq_type in enumerate(active_seq_types)
+                    if seq_type in ("fill_compute", "fill_request")
+                ]
+                if len(fill_inds) > 1:
+                    stopped_fills = dict(zip(fill_inds, _fill_bufs_in_threads(
+                        [(active_seqs[ind], get_buf(ind)) for ind in fill_inds]
+                    )))
+
             # iterate on active sequences
             ind = 0
+            # index of the sequence before this buffer,
+            # which doesn't change when sequences are removed
+            buf_ind = -1
             while ind < n_of_active_seqs:
-                if self._copy_buf and n_of_active_seqs - ind > 1:
-                    # last sequence doesn't need a copy of the buffer
-                    buf = copy.deepcopy(orig_buf)
-                else:
-                    buf = orig_buf
+                buf_ind += 1
                 seq = active_seqs[ind]
                 seq_type = active_seq_types[ind]
 
@@ -341,13 +422,10 @@ class Split(LenaSplit):
                     n_of_active_seqs -= 1
                     continue
                 elif seq_type == "fill_compute":
-                    stopped = False
-                    for val in buf:
-                        try:
-                            seq.fill(val)
-                        except exceptions.LenaStopFill:
-                            stopped = True
-                            break
+                    if buf_ind in stopped_fills:
+                        stopped = stopped_fills[buf_ind]
+                    else:
+                        stopped = _fill_buf(seq, get_buf(buf_ind))
                     if stopped:
                         for result in seq.compute():
                             yield result
@@ -359,13 +437,10 @@ class Split(LenaSplit):
                         n_of_active_seqs -= 1
                         continue
                 elif seq_type == "fill_request":
-                    stopped = False
-                    for val in buf:
-                        try:
-                            seq.fill(val)
-                        except exceptions.LenaStopFill:
-                            stopped = True
-                            break
+                    if buf_ind in stopped_fills:
+                        stopped = stopped_fills[buf_ind]
+                    else:
+                        stopped = _fill_buf(seq, get_buf(buf_ind))
                     # FillRequest yields each time after buffer is filled
                     for result in seq.request():
                         yield result
@@ -378,7 +453,7 @@ class Split(LenaSplit):
                     # run buf as a whole flow.
                     # this may be very wrong if seq has internal state,
                     # e.g. contains a Cache
-                    for res in seq.run(buf):
+                    for res in seq.run(get_buf(buf_ind)):
                         yield res
                 # this is not needed, because can't be tested.
                 # else:
@@ -205,21 +205,24 @@ class Cache(object):
 
     def _dump_flow_and_yield(self, flow):
         # fill cache and yield values
+        dump, protocol = self._dump, self.protocol
         with open(self._filename, "wb") as f:
-            dump = lambda val: self._dump(val, f, self.protocol)
             for val in flow:
                 # if there were an error in a next element,
                 # our value will be saved first (before yielding)
-                dump(val)
+                dump(val, f, protocol)
                 yield val
 
 
     def _load_flow(self):
         """Load flow from self.filename."""
         with open(self._filename, "rb") as f:
+            # each value is a separate pickle with its own memo,
+            # so it must be loaded by a new unpickler
+            load = self._load
             while True:
                 try:
-                    val = self._load(f)
+                    val = load(f)
                     yield val
                 except EOFError:
                     break
@@ -1,4 +1,5 @@
 """Elements that work with the flow."""
+import array
 import collections
 import copy
 import itertools
@@ -41,7 +42,12 @@ class Count(object):
     def fill(self, value):
         """Increase *count* and set current context from *value*."""
         self.count += 1
-        self._cur_context = lena.flow.get_context(value)
+        # get_context is inlined, since fill is called for every value
+        if (isinstance(value, tuple) and len(value) == 2
+                and isinstance(value[1], dict)):
+            self._cur_context = value[1]
+        else:
+            self._cur_context = {}
 
     def compute(self):
         """Yield *(count, context)*.
@@ -278,7 +284,7 @@ class RunningChunkBy(object):
 class StoreFilled(object):
     """Store filled items."""
 
-    def __init__(self, yield_as_a_group=True):
+    def __init__(self, yield_as_a_group=True, typecode=None):
         """If *yield_as_a_group* is ``False``,
         values are yielded one by one in :meth:`compute`.
         By default they are yielded as a group.
@@ -286,13 +292,24 @@ class StoreFilled(object):
         A public attribute :attr:`group`
         allows access to the list of filled values.
 
+        If *typecode* is given, numbers are stored
+        in an :class:`array.array` with that type code
+        (for example, ``"d"`` for floats)
+        instead of a list. This takes less memory,
+        but only numbers of that type can be filled.
+        An unknown *typecode* raises :exc:`.LenaValueError`.
+
         This class is memory unsafe by definition.
         It is used mostly for testing purposes.
         """
-        # that could be another container (set,...)
-        # if we allow that in the future
-        self.group = []
+        self._typecode = typecode
         self._yield_as_a_group = yield_as_a_group
+        if typecode is not None:
+            try:
+                array.array(typecode)
+            except (TypeError, ValueError) as err:
+                raise lena.core.LenaValueError(err)
+        self.reset()
 
     def fill(self, value):
         """Add *value* to the collected items."""
@@ -316,7 +333,12 @@ class StoreFilled(object):
 
     def reset(self):
         """Clear the group."""
-        self.group = []
+        # that could be another container (set,...)
+        # if we allow that in the future
+        if self._typecode is None:
+            self.group = []
+        else:
+            self.group = array.array(self._typecode)
 
 
 class End(object):
@@ -4,13 +4,13 @@ import inspect
 import sys
 
 import lena
-from lena.core import LenaKeyError, LenaTypeError
+from lena.core import LenaKeyError, LenaTypeError, LenaValueError
 
 
 class ReadROOTFile():
     """Read ROOT files from flow."""
 
-    def __init__(self, keys=None, raise_on_missing=False):
+    def __init__(self, keys=None, raise_on_missing=False, chain=False):
         """*keys* specify which objects should be read from ROOT files.
         They can be a list of allowed objects' names or a single name.
         By default, all keys are read. ROOT files can store several
@@ -20,6 +20,14 @@ class ReadROOTFile():
         If an explicitly given key was not found, a :exc:`.LenaKeyError`
         is raised if *raise_on_missing* is ``True``.
         By default missing keys are ignored.
+
+        If *chain* is ``True``, *keys* must be names of trees.
+        All files from the flow are combined, and for each key
+        one *TChain* over these files is yielded.
+        This avoids opening each file separately
+        and allows ROOT to prefetch data across files.
+        If *chain* is set and no *keys* are given,
+        :exc:`.LenaValueError` is raised.
         """
         import ROOT
 
@@ -41,8 +49,12 @@ class ReadROOTFile():
                 if any((not isinstance(key, basestring) for key in keys)):
                     raise key_error
 
+        if chain and keys is None:
+            raise LenaValueError("keys must be set to chain trees")
+
         self._keys = keys
         self._raise_on_missing = raise_on_missing
+        self._chain = chain
         # maybe todo: allow regular expressions,
         # allow ROOT object versions.
         # ROOT files can store several keys with the same name
@@ -67,6 +79,11 @@ class ReadROOTFile():
             Make all processing within one flow:
             don't save yielded values to a list,
             or save copies of them.
+
+        If trees are chained, *context* is the intersection
+        of contexts of all values from *flow*,
+        and *input.root_file_path* is the list of all paths.
+        Missing trees are not checked in this case.
         """
         import ROOT
         from ROOT import TFile
@@ -74,6 +91,11 @@ class ReadROOTFile():
         from lena.flow import get_data_context
         from copy import deepcopy
 
+        if self._chain:
+            for val in self._run_chain(flow):
+                yield val
+            return
+
         for val in flow:
             data, context = get_data_context(val)
 
@@ -118,3 +140,35 @@ class ReadROOTFile():
                 yield (obj, new_context)
 
             root_file.Close()
+
+    def _run_chain(self, flow):
+        from ROOT import TChain
+        from lena.context import intersection, update_recursively
+        from lena.flow import get_data_context
+
+        paths = []
+        contexts = []
+        for val in flow:
+            data, context = get_data_context(val)
+            paths.append(data)
+            contexts.append(context)
+        if not paths:
+            return
+        context = intersection(*contexts)
+        update_recursively(
+            context, {"input": {"root_file_path": paths}}
+        )
+
+        for key in self._keys:
+            chain = TChain(key)
+            for path in paths:
+                chain.Add(path)
+            # read-ahead cache for all branches, 10 MB
+            chain.SetCacheSize(10*1024*1024)
+            chain.AddBranchToCache("*", True)
+
+            new_context = copy.deepcopy(context)
+            update_recursively(
+                new_context, {"input": {"root_file_key": key}}
+            )
+            yield (chain, new_context)
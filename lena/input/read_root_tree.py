@@ -1,6 +1,6 @@
 # needs ROOT installed
 import collections
-import copy
+import operator
 import sys
 
 import lena
@@ -171,9 +171,17 @@ class ReadROOTTree():
         tup_name = tree_name + "_entry" if tree_name else "tree_entry"
         entry_tuple = collections.namedtuple(tup_name, leaves_names)
 
-        # yield entries
-        for entry in tree:
-            yield entry_tuple(*(getattr(entry, lf) for lf in leaves))
+        # yield entries.
+        # attrgetter gets all leaves in one C call.
+        get_leaves = operator.attrgetter(*leaves)
+        if len(leaves) == 1:
+            # attrgetter returns a single value
+            for entry in tree:
+                yield entry_tuple(get_leaves(entry))
+        else:
+            make_entry = entry_tuple._make
+            for entry in tree:
+                yield make_entry(get_leaves(entry))
 
     def run(self, flow):
         """Read ROOT trees from *flow* and yield their contents.
@@ -187,9 +195,12 @@ class ReadROOTTree():
         specify branch names for them.
         """
         import ROOT
+        from lena.context.functions import _fast_clone
         get_data_context = lena.flow.get_data_context
         update_recursively = lena.context.update_recursively
-        deepcopy = copy.deepcopy
+        # the same context is copied for every entry,
+        # so a fast copy is important here
+        clone = _fast_clone
 
         for val in flow:
             # get tree
@@ -214,7 +225,7 @@ class ReadROOTTree():
             # get entries
             if self._leaves:
                 for data in self._read_leaves(tree):
-                    yield (data, deepcopy(context))
+                    yield (data, clone(context))
             elif self._get_entries:
                 for entry in self._get_entries(tree):
-                    yield (entry, deepcopy(context))
+                    yield (entry, clone(context))
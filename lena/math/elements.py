@@ -228,9 +228,14 @@ class Sum(object):
         The last *context* value (considered empty if missing)
         sets the current context.
         """
-        data, context = lena.flow.get_data_context(value)
-        self._total += data
-        self._cur_context = context
+        # get_data_context is inlined, since fill is called for every value
+        if (isinstance(value, tuple) and len(value) == 2
+                and isinstance(value[1], dict)):
+            self._total += value[0]
+            self._cur_context = value[1]
+        else:
+            self._total += value
+            self._cur_context = {}
 
     def compute(self):
         """Calculate the sum and yield.
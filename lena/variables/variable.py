@@ -40,12 +40,63 @@ True
 :class:`Combine` and :class:`Compose` are subclasses
 of a :class:`Variable`.
 """
-import copy
-from copy import deepcopy
+import inspect
+import operator
 
 import lena.core
 import lena.context
 import lena.flow
+from lena.context.functions import _fast_clone
+
+
+# all copies of contexts in this module are made with _clone,
+# so that its implementation can be changed in one place
+_clone = _fast_clone
+
+
+# code of trivial lambdas paired with the constant they use.
+# They are compiled by this interpreter, so that their bytecode
+# is the same as of user lambdas with the same structure.
+_ITEM_TEMPLATES = [
+    ((lambda x: x["key"]).__code__, "key"),
+    ((lambda x: x[0]).__code__, 0),
+]
+_ATTR_TEMPLATE = (lambda x: x.name).__code__
+
+
+def _simplify_getter(getter):
+    """Replace a trivial lambda *getter* with a C-implemented one.
+
+    *lambda x: x[key]* becomes :func:`operator.itemgetter` *(key)*,
+    *lambda x: x.attr* becomes :func:`operator.attrgetter` *("attr")*.
+    Other getters are returned unchanged.
+    """
+    def same_flags(code, template):
+        # lambdas defined inside functions are nested
+        return ((code.co_flags | inspect.CO_NESTED)
+                == (template.co_flags | inspect.CO_NESTED))
+
+    code = getattr(getter, "__code__", None)
+    if (code is None or code.co_name != "<lambda>"
+            or code.co_argcount != 1 or getter.__defaults__
+            # keyword-only arguments (Python 3)
+            or getattr(code, "co_kwonlyargcount", 0)
+            or getter.__closure__):
+        return getter
+    for template, key in _ITEM_TEMPLATES:
+        if (code.co_code == template.co_code
+                and same_flags(code, template)
+                and len(code.co_consts) == len(template.co_consts)):
+            if key in template.co_consts:
+                key = code.co_consts[template.co_consts.index(key)]
+            # otherwise the constant is a part of the bytecode
+            return operator.itemgetter(key)
+    template = _ATTR_TEMPLATE
+    if (code.co_code == template.co_code
+            and same_flags(code, template)
+            and len(code.co_names) == 1):
+        return operator.attrgetter(code.co_names[0])
+    return getter
 
 
 class Variable(object):
@@ -75,7 +126,9 @@ class Variable(object):
 
         **Attributes**
 
-        *getter*
+        *getter*. Trivial lambdas like *lambda x: x[0]*
+        or *lambda x: x.attr* are replaced by their
+        faster equivalents from the :mod:`operator` module.
 
         *var_context* is the dictionary of attributes of the variable.
         It is added to *context.variable* during :meth:`__call__`.
@@ -103,7 +156,7 @@ class Variable(object):
         # (without context)
         # But probably for unification with other "performance" features
         # its name may be changed in the future.
-        object.__setattr__(self, "getter", getter)
+        object.__setattr__(self, "getter", _simplify_getter(getter))
         # getter doesn't go into var_context.
         # since we have setattr, we must use this syntax here.
         # self.getter = getter
@@ -116,7 +169,7 @@ class Variable(object):
             # self.var_context["type"] = type
             varc = self.var_context
             varc.update(
-                {type: deepcopy(varc)}
+                {type: _clone(varc)}
             )
             # we store type in this variable context,
             # but not in its type subcontext.
@@ -132,7 +185,12 @@ class Variable(object):
         If context already contained *variable*, it is preserved as
         *context.variable.compose* subcontext.
         """
-        data, context = lena.flow.get_data_context(value)
+        # inlined get_data_context for the most common case
+        if (type(value) is tuple and len(value) == 2
+                and isinstance(value[1], dict)):
+            data, context = value
+        else:
+            data, context = lena.flow.get_data_context(value)
         data = self.getter(data)
         # Run and Call elements don't make a deep copy of context.
         # update_context was made a separate function,
@@ -140,8 +198,10 @@ class Variable(object):
         # (like SplitIntoBins or IterateBins) - but not needed now.
         # Maybe _update_context call should be optimized out.
         # deep copy, because we don't know
-        # whether users will have nested keys
-        self._update_context(context, copy.deepcopy(self.var_context))
+        # whether users will have nested keys.
+        # A fresh copy is made for each value (no pool of contexts
+        # is reused), since contexts can be stored downstream.
+        self._update_context(context, _clone(self.var_context))
         return (data, context)
 
     def __getattr__(self, name):
@@ -299,7 +359,7 @@ class Combine(Variable):
         assert "dim" not in kwargs  # to set it manually is meaningless
         var_context.update({"dim": self.dim})
         var_context["combine"] = tuple(
-            copy.deepcopy(var.var_context) for var in self._vars
+            _clone(var.var_context) for var in self._vars
         )
 
         super(Combine, self).__init__(name=name, getter=getter, **var_context)
@@ -347,10 +407,10 @@ class Compose(Variable):
 
         # composition of functions must be almost the same
         # as those functions in a sequence.
-        compose = {"variable": copy.deepcopy(self._vars[0].var_context)}
+        compose = {"variable": _clone(self._vars[0].var_context)}
 
         for var in self._vars[1:]:
-            varc = copy.deepcopy(var.var_context)
+            varc = _clone(var.var_context)
             Variable._update_context(compose, varc)
 
         var_context = compose["variable"]
@@ -4,7 +4,7 @@ import pickle
 
 import pytest
 
-import lena.core
+from lena.core import LenaAttributeError, LenaTypeError
 from lena.context import Context
 
 
@@ -15,11 +15,20 @@ def test_context():
     ## repr
     # default formatter
     assert c.__repr__() == json.dumps(d, sort_keys=True, indent=4)
+    # repr is updated after a nested change
+    c2 = Context({'a': {'b': 1}})
+    assert repr(c2) == json.dumps({'a': {'b': 1}}, sort_keys=True, indent=4)
+    c2['a']['b'] = 1.
+    assert repr(c2) == json.dumps({'a': {'b': 1.}}, sort_keys=True, indent=4)
+    # unserializable contents raise
+    c2['a']['b'] = set()
+    with pytest.raises(TypeError):
+        repr(c2)
     # custom formatter
     c1 = Context(formatter=lambda s: "")
     assert c1.__repr__() == ""
     # oops, formatter must be callable
-    with pytest.raises(lena.core.LenaTypeError):
+    with pytest.raises(LenaTypeError):
         c1 = Context(formatter="")
 
     ## call
@@ -29,25 +38,52 @@ def test_context():
     # Context can also be accepted
     res = c((1, Context()))
     assert res[1] == Context({})
+    # and is not converted again
+    c3 = Context({"c": 3})
+    assert c((1, c3))[1] is c3
 
     ## attribute access
-    d1 = copy.deepcopy(d)
-    c = Context(d1)
+    c = Context(d)
     assert c.a == d["a"]
     # missing attributes raise
-    with pytest.raises(lena.core.LenaAttributeError):
+    with pytest.raises(LenaAttributeError):
         c.b
     c.b = 3
-    d1["b"] = 3
-    assert c == d1
+    assert c == {'a': {'b': 'c d'}, 'b': 3}
+    # the initial dictionary is not changed
+    assert d == {'a': {'b': 'c d'}}
     # private attributes raise
     with pytest.raises(AttributeError):
         c._aaa = 3
     with pytest.raises(AttributeError):
         c._aaa
 
+    ## Context can be deeply copied
+    c4 = Context({"a": {"b": [1]}}, formatter=json.dumps)
+    c5 = copy.deepcopy(c4)
+    assert c5 == c4 and isinstance(c5, Context)
+    assert c5["a"]["b"] is not c4["a"]["b"]
+    assert repr(c5) == repr(c4)
+    assert repr(copy.deepcopy(c)) == repr(c)
+    # shared references and cycles are kept
+    c6 = Context({"a": [1]})
+    c6["self"] = [c6]
+    pair = copy.deepcopy([c6, c6])
+    assert pair[0] is pair[1] and pair[0] is not c6
+    assert pair[0]["self"][0] is pair[0]
+    c7 = copy.deepcopy(Context({"x": c4["a"], "y": c4["a"]}))
+    assert c7["x"] is c7["y"] and c7["x"] is not c4["a"]
+
     ## Context can be pickled
     d2 = {"a": "b"}
     c2 = Context(d2)
     picklestring = pickle.dumps(c2)
     assert pickle.loads(picklestring) == c2
+    # cached representation is not pickled
+    repr(c2)
+    assert pickle.dumps(c2) == picklestring
+    # default formatter is not pickled
+    assert b"json" not in picklestring
+    # custom formatter is pickled
+    c3 = pickle.loads(pickle.dumps(Context(d2, formatter=json.dumps)))
+    assert repr(c3) == json.dumps(d2)
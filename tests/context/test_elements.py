@@ -1,8 +1,7 @@
-from copy import deepcopy
-
 import pytest
 
 from lena.context import DeleteContext
+from lena.context.functions import _fast_clone
 
 
 def test_delete_context():
@@ -15,7 +14,7 @@ def test_delete_context():
 
     # missing keys are skipped
     dcd = DeleteContext("d")
-    assert dcd(deepcopy(value)) == value
+    assert dcd(_fast_clone(value)) == value
 
     # present keys are removed
     dcb = DeleteContext("a.b")
@@ -25,6 +24,13 @@ def test_delete_context():
     # we leave the empty subcontext to show that there was some.
     new_val = (1, {"a": {}})
 
-    assert dcb(deepcopy(value))  == new_val
-    assert dcbt(deepcopy(value)) == new_val
-    assert dcbl(deepcopy(value)) == new_val
+    assert dcb(_fast_clone(value))  == new_val
+    assert dcbt(_fast_clone(value)) == new_val
+    assert dcbl(_fast_clone(value)) == new_val
+
+    # not dictionary subcontexts are skipped
+    value = (1, {"a": "b"})
+    assert dcb(_fast_clone(value)) == value
+
+    # empty key removes the entire context
+    assert DeleteContext("")(_fast_clone(value)) == (1, {})
@@ -1,3 +1,4 @@
+import sys
 from copy import deepcopy
 
 import pytest
@@ -11,6 +12,7 @@ from lena.context import (
     str_to_dict, str_to_list, to_string,
     update_recursively, update_nested,
 )
+from lena.context.functions import _fast_clone, intern
 
 
 def test_contains():
@@ -21,6 +23,12 @@ def test_contains():
     assert contains(d, "a.b") is True
     # not string contents are cast to strings
     assert contains(d, "e.1") is True
+    # values with dots can be compared
+    assert contains({"e": 1.5}, "e.1.5") is True
+    assert contains({"e": 1.5}, "e.1") is False
+    # strings are not searched for substrings
+    assert contains(d, "a.b.c d.e") is False
+    assert contains(d, "a.b.c") is False
     ## test values with exception when cast to string
     class NoString():
         def __repr__(self):
@@ -62,6 +70,23 @@ def test_difference():
     # d1.diff(d2) + d1.intersection(d2) = d1.
 
 
+def test_fast_clone():
+    func = lambda x: x
+    obj = {"a": [1, (2., "b")], "c": {"d": None}, "f": func}
+    obj_copy = _fast_clone(obj)
+    # result is same as for deepcopy
+    assert obj_copy == deepcopy(obj)
+    assert obj_copy is not obj
+    assert obj_copy["a"] is not obj["a"]
+    assert obj_copy["c"] is not obj["c"]
+    # functions are copied as in deepcopy
+    assert obj_copy["f"] is func
+    # tuples work
+    value = (1, {"a": {"b": "c"}})
+    assert _fast_clone(value) == value
+    assert _fast_clone(value)[1]["a"] is not value[1]["a"]
+
+
 def test_format_context():
     """Note that formatting errors may be very tricky to understand.
 
@@ -91,6 +116,10 @@ def test_format_context():
     # new double braces work
     f = format_context("{{x}}")
     assert f({"x": 10}) == "10"
+    # formatters are reused
+    assert format_context("{{x}}") is f
+    # strings without fields don't need context
+    assert format_context("x")(None) == "x"
     f = format_context("{{x.y}}")
     assert f({"x": {"y": 10}}) == "10"
     # # special string doesn't work with keyword arguments
@@ -108,6 +137,10 @@ def test_format_context():
     with pytest.raises(LenaKeyError):
         f({})
     f = format_context("{{x} }")
+    with pytest.raises(ValueError):
+        f({"x": 10})
+    # errors in unterminated fields are raised during formatting
+    f = format_context("}}{{x")
     with pytest.raises(ValueError):
         f({"x": 10})
 
@@ -171,7 +204,7 @@ def test_format_update_with():
 
     # key formatting and update works
     d = {"detector": "FDI", "data_type": "data"}
-    d1 = deepcopy(d)
+    d1 = dict(d)
     key, val = ("name", "{{detector}}_{{data_type}}")
     fuw(key, val, d1)
     assert d1 == {'data_type': 'data', 'detector': 'FDI',
@@ -218,6 +251,10 @@ def test_get_recursively():
     # list as input
     assert get_recursively(context, ["output", "latex", "name"], default="") == "x"
     assert get_recursively(context, ["output", "latex"], default="") == {"name": "x"}
+    # tuple as input
+    assert get_recursively(context, ("output", "latex", "name")) == "x"
+    assert get_recursively(context, ()) is context
+    assert get_recursively(context, ("output", "tex"), default=0) == 0
     # missing values raise
     with pytest.raises(LenaKeyError):
         get_recursively(context, "output.lalalatex")
@@ -227,6 +264,11 @@ def test_get_recursively():
         get_recursively(context, ["output", "latex", "name???"])
     with pytest.raises(LenaKeyError):
         get_recursively(context, ["output", "latex??", "name???"])
+    # intermediate values must be dictionaries
+    with pytest.raises(LenaKeyError):
+        get_recursively(context, "output.latex.name.x")
+    # values that are None are found
+    assert get_recursively({"a": {"b": None}}, "a.b", default=1) is None
 
     ## test dict as input
     assert get_recursively(context, {"output": {"latex": "name"}}) == "x"
@@ -240,6 +282,9 @@ def test_intersection():
     d1 = {1: "1", 2: "2"}
     d2 = dict(d1)
     assert intersection(d1, d2) == d1
+    # intersection with the same object is its copy
+    assert intersection(d1, d1) == d1
+    assert intersection(d1, d1) is not d1
 
     # intersection with empty dictionary is empty
     assert intersection(d1, {}) == {}
@@ -272,6 +317,26 @@ def test_intersection():
     with pytest.raises(LenaTypeError):
         intersection(d1, d2, wrong_kw=True)
 
+    # values are taken from the first dictionary,
+    # whichever dictionary is smaller
+    d6 = {1: 1.0, 2: {3: 3.0}}
+    d7 = {1: 1, 2: {3: 3, 4: 4}, 5: 5}
+    res = intersection(d6, d7)
+    assert res == d6 and isinstance(res[1], float)
+    assert isinstance(res[2][3], float)
+    res = intersection(d7, d6)
+    assert res == {1: 1, 2: {3: 3}} and isinstance(res[1], int)
+    assert isinstance(res[2][3], int)
+    # values are copied
+    assert res[2] is not d7[2]
+    # dicts are not changed
+    assert d6 == {1: 1.0, 2: {3: 3.0}}
+    assert d7 == {1: 1, 2: {3: 3, 4: 4}, 5: 5}
+    # the result has the type of the first dictionary
+    res = intersection(lena.context.Context(d7), d6)
+    assert isinstance(res, lena.context.Context)
+    assert res == {1: 1, 2: {3: 3}}
+
 
 def test_str_to_dict():
     ## test with only one argument
@@ -296,6 +361,14 @@ def test_str_to_list():
     # empty string produces an empty list
     assert str_to_list("") == []
     assert str_to_list(".a..") == ["", "a", "", ""]
+    # results are independent
+    lst = str_to_list("a.b")
+    lst.append("c")
+    assert str_to_list("a.b") == ["a", "b"]
+    # keys are interned
+    key = "".join(["out", "put"])
+    assert str_to_list(key + ".x")[0] is intern(key)
+    assert list(str_to_dict(key + ".x", 1))[0] is intern(key)
 
 
 def test_to_string():
@@ -307,6 +380,10 @@ def test_to_string():
     d2 = {"a": [1, 2, 3]}
     assert to_string(d2) == '{"a":[1,2,3]}'
 
+    # output is the same as of json.dumps
+    d3 = {"b": u"\u00e9", "a": float("nan"), "1": None}
+    assert to_string(d3) == '{"1":null,"a":NaN,"b":"\\u00e9"}'
+
     # unserializable types raise
     with pytest.raises(LenaValueError) as err:
         to_string({"a": set()})
@@ -337,6 +414,18 @@ def test_update_nested():
     d2["d"] = d2
     with pytest.raises(LenaValueError):
         update_nested("d", d1, d2)
+    # indirect recursion is forbidden
+    d1 = {"d": {}}
+    d2 = {}
+    d2["d"] = {"d": d2}
+    with pytest.raises(LenaValueError):
+        update_nested("d", d1, d2)
+
+    # deeply nested other works
+    d1 = {"d": 1}
+    d2 = {"d": {"d": {"e": 2}}}
+    update_nested("d", d1, d2)
+    assert d1 == {"d": {"d": {"d": {"d": 1, "e": 2}}}}
 
 
 def test_update_recursively():
@@ -353,6 +442,17 @@ def test_update_recursively():
     update_recursively(d1, {"a": {"b": "c"}})
     assert d1 == {"a": {"b": "c"}, "b": 2, "e": {"f": 2}}
 
+    # deep nesting doesn't hit the recursion limit
+    deep_d, deep_other = {}, {}
+    d, other = deep_d, deep_other
+    for _ in range(sys.getrecursionlimit() + 10):
+        d["a"] = {}
+        other["a"] = {}
+        d, other = d["a"], other["a"]
+    other["b"] = 1
+    update_recursively(deep_d, deep_other)
+    assert d == {"b": 1}
+
     ## test explicit value
     d_empty = {}
     update_recursively(d_empty, "output.changed", True)
@@ -9,10 +9,11 @@ From this and (1) a similar thing for an exclude follows.
 """
 import pytest
 
-from lena.core import LenaValueError
+from lena.core import LenaTypeError, LenaValueError
 
 from lena.context.include_exclude_tree import (
-    _group_by_starting_prefixes, _split_key, make_include_exclude_tree,
+    _group_by_starting_prefixes, _make_include_exclude_tree, _split_key,
+    make_include_exclude_tree,
     _startswith
 )
 from lena.context import IncludeExcludeTree
@@ -95,6 +96,10 @@ def test_include_exclude_tree():
     c3 = {"a": 1, "b": 2, "c": "d"}
     assert iet3.get(c3) == {"b": 2}
 
+    # nested subtrees work
+    iet5 = IET([], {"c": iet3}, include=False)
+    assert iet5.get({"a": 1, "c": c2}) == {"c": {"b": 2, "c": {"d": 3}}}
+
     # equality testing works
     assert iet3 == iet3
     assert iet3 != iet4
@@ -122,6 +127,24 @@ def test_make_include_exclude_tree():
     )
     assert iet1.get(c2) == {"a": 1, "b": 2, "c": {"d": 3}}
 
+    ## trees for same selectors are equal, but not shared
+    iet3 = make_include_exclude_tree(includes=["", "c.d"], excludes="c")
+    assert iet3 == iet1 and iet3 is not iet1
+    del iet3.subtrees["c"]
+    assert make_include_exclude_tree(
+        includes=["", "c.d"], excludes="c"
+    ).get(c2) == {"a": 1, "b": 2, "c": {"d": 3}}
+    # keys must be strings
+    with pytest.raises(LenaTypeError):
+        make_include_exclude_tree(includes=["", ["c"]])
+    # trees can be hashed
+    iet2 = _make_include_exclude_tree(
+        includes=[["c", "d"]], excludes=[["c"]], is_default_include=True
+    )
+    assert iet2 == iet1 and iet2 is not iet1
+    assert hash(iet2) == hash(iet1)
+    assert len({iet1, iet2, iet_true}) == 2
+
 
 def test_split_key():
     # keys are split by dots properly
@@ -1,14 +1,16 @@
-import copy
 import pytest
 
-import lena.core
 from lena.context import UpdateContext
 from lena.core import LenaValueError, LenaTypeError, LenaKeyError
 
 
+def nested_data():
+    # UpdateContext changes its input, so fresh data is made for each call
+    return (0, {"data": {"yes": {"Yes": "YES"}}})
+
+
 def test_update_context_subcontext():
     data = (0, {"data": "yes"})
-    orig_data = copy.deepcopy(data)
 
     # empty subcontext is difficult. If encountered runtime, it should be probably skipped.
     ## and don't do 100% tests of developed or new classes...
@@ -16,87 +18,102 @@ def test_update_context_subcontext():
     # uc1 = UpdateContext("", {}, recursively=False)
     # assert uc1(data) == (0, {})
     # assert data == (0, {})
-    # data = orig_data
     # # update all context recursively preserves existing data
     # uc12 = UpdateContext("", {"new_data": "no"})
-    # assert uc12(copy.deepcopy(data)) == (0, {"data": "yes", "new_data": "no"})
+    # assert uc12((0, {"data": "yes"})) == (0, {"data": "yes", "new_data": "no"})
 
     # subcontext must be a string or a dict
-    with pytest.raises(lena.core.LenaTypeError):
+    with pytest.raises(LenaTypeError):
         UpdateContext(0, {})
     # subcontext must be non-empty
-    with pytest.raises(lena.core.LenaValueError):
+    with pytest.raises(LenaValueError):
         UpdateContext("", 0)
 
 
-def test_update_context_update_not_str():
-    data = (0, {"data": "yes"})
+@pytest.mark.parametrize("data, subcontext, update, kwargs, result", [
     # update can be not a dict or a string
-    uc13 = UpdateContext("data", 0)
-
-    # representation works
-    assert repr(uc13) == 'UpdateContext("data", 0)'
-
-    # equality testing works
-    assert uc13 == UpdateContext("data", 0)
-    assert uc13 != UpdateContext("data", 1)
-
-    # for simple value default, skip_on_missing and raise_on_missing
-    # can't be set
-    with pytest.raises(LenaValueError):
-        UpdateContext("data", 0, default="")
-    assert uc13(copy.deepcopy(data)) == (0, {"data": 0})
+    ((0, {"data": "yes"}), "data", 0, {}, (0, {"data": 0})),
     # simple string
-    uc14 = UpdateContext("data", "data")
-    assert uc14(copy.deepcopy(data)) == (0, {"data": "data"})
+    ((0, {"data": "yes"}), "data", "data", {}, (0, {"data": "data"})),
     # formatting string
-    uc15 = UpdateContext("data", "{{data}}")
-    assert uc15(copy.deepcopy(data)) == (0, {"data": "yes"})
-
+    ((0, {"data": "yes"}), "data", "{{data}}", {}, (0, {"data": "yes"})),
     # non-empty subcontext is a proper subcontext
-    uc2 = UpdateContext("new_data", {"new_data": "Yes"})
-    assert uc2(copy.deepcopy(data)) == (0, {"data": "yes", "new_data": {"new_data": "Yes"}})
-    uc3 = UpdateContext("data", {"new_data": "Yes"})
-    assert uc3(copy.deepcopy(data)) == (0, {"data": {"new_data": "Yes"}})
-
+    ((0, {"data": "yes"}), "new_data", {"new_data": "Yes"}, {},
+     (0, {"data": "yes", "new_data": {"new_data": "Yes"}})),
+    ((0, {"data": "yes"}), "data", {"new_data": "Yes"}, {},
+     (0, {"data": {"new_data": "Yes"}})),
     # nested subcontext works
-    data = (0, {"data": {"yes": {"Yes": "YES"}}})
-    uc4 = UpdateContext("data.yes", {"new_data": "Yes"})
     # recursively preserves context
-    assert uc4(copy.deepcopy(data)) == (0, {"data": {"yes": {"Yes": "YES", "new_data": "Yes"}}})
+    ((0, {"data": {"yes": {"Yes": "YES"}}}), "data.yes", {"new_data": "Yes"},
+     {}, (0, {"data": {"yes": {"Yes": "YES", "new_data": "Yes"}}})),
     # non-recursively overwrites context
-    uc5 = UpdateContext("data.yes", {"new_data": "Yes"}, recursively=False)
-    assert uc5(copy.deepcopy(data)) == (0, {"data": {"yes": {"new_data": "Yes"}}})
+    ((0, {"data": {"yes": {"Yes": "YES"}}}), "data.yes", {"new_data": "Yes"},
+     {"recursively": False}, (0, {"data": {"yes": {"new_data": "Yes"}}})),
     # key not in subdictionary
-    data = (0, {"data": {"_yes": {"Yes": "YES"}}})
-    uc6 = UpdateContext("data.yes.Yes", {"new_data": "Yes"}, recursively=False)
-    assert uc6(copy.deepcopy(data)) == (
-        0,
-        {
-            "data": {
-                "yes": {"Yes": {"new_data": "Yes"}},
-                "_yes": {"Yes": "YES"}
-            }
-        }
-    )
-    with pytest.raises(LenaValueError):
-        UpdateContext("data.yes.Yes", {"new_data": "Yes"}, skip_on_missing=True, raise_on_missing=True)
-    with pytest.raises(LenaValueError):
-        UpdateContext("data", "{{new_data}}", value=True, skip_on_missing=True, raise_on_missing=True)
-    with pytest.raises(LenaValueError):
-        UpdateContext("data", "{{new_data}}", value=True, default=0, raise_on_missing=True)
-    with pytest.raises(LenaValueError):
-        UpdateContext("data", "{{new_data}}", value=True, default=0, skip_on_missing=True)
+    ((0, {"data": {"_yes": {"Yes": "YES"}}}), "data.yes.Yes",
+     {"new_data": "Yes"}, {"recursively": False},
+     (0, {"data": {"yes": {"Yes": {"new_data": "Yes"}},
+                   "_yes": {"Yes": "YES"}}})),
+])
+def test_update_context_call(data, subcontext, update, kwargs, result):
+    # parameters are created anew for each test,
+    # so data can be changed
+    uc = UpdateContext(subcontext, update, **kwargs)
+    assert uc(data) == result
+
+
+def test_update_context_copies_update():
+    # updates are not shared between contexts
+    uc = UpdateContext("data", {"new_data": ["Yes"]})
+    _, context1 = uc((0, {}))
+    _, context2 = uc((0, {}))
+    context1["data"]["new_data"].append("No")
+    assert context2 == {"data": {"new_data": ["Yes"]}}
+    # same for context values
+    uc2 = UpdateContext("new", "{{data}}", value=True)
+    context = {"data": {"yes": ["Yes"]}}
+    _, context = uc2((0, context))
+    assert context["new"] == context["data"]
+    assert context["new"]["yes"] is not context["data"]["yes"]
+
+
+@pytest.mark.parametrize("args, kwargs", [
+    # for simple value default, skip_on_missing and raise_on_missing
+    # can't be set
+    (("data", 0), {"default": ""}),
+    (("data.yes.Yes", {"new_data": "Yes"}),
+     {"skip_on_missing": True, "raise_on_missing": True}),
+    # only one of skip_on_missing, raise_on_missing or default
+    (("data", "{{new_data}}"),
+     {"value": True, "skip_on_missing": True, "raise_on_missing": True}),
+    (("data", "{{new_data}}"),
+     {"value": True, "default": 0, "raise_on_missing": True}),
+    (("data", "{{new_data}}"),
+     {"value": True, "default": 0, "skip_on_missing": True}),
+    # default for a formatting string must be set inside it
+    (("data", "{{new_data}}"), {"default": ""}),
+])
+def test_update_context_invalid_flag_combos(args, kwargs):
     with pytest.raises(LenaValueError):
-        UpdateContext("data", "{{new_data}}", default="")
+        UpdateContext(*args, **kwargs)
+
+
+def test_update_context_update_not_str():
+    uc13 = UpdateContext("data", 0)
+
+    # representation works
+    assert repr(uc13) == 'UpdateContext("data", 0)'
+
+    # equality testing works
+    assert uc13 == UpdateContext("data", 0)
+    assert uc13 != UpdateContext("data", 1)
 
 
 def test_skip_on_missing():
-    data = (0, {"data": {"yes": {"Yes": "YES"}}})
 
     # update format string
     uc1 = UpdateContext("data", "{{data.yes}}", recursively=False, skip_on_missing=True)
-    assert uc1(copy.deepcopy(data))[1] == {"data": "{'Yes': 'YES'}"}
+    assert uc1(nested_data())[1] == {"data": "{'Yes': 'YES'}"}
     d = {}
     assert uc1((0, d))[1] is d
 
@@ -105,16 +122,15 @@ def test_skip_on_missing():
         "data", "{{data.yes}}", value=True, skip_on_missing=True,
         recursively=False
     )
-    assert uc2(copy.deepcopy(data))[1] == {"data": {'Yes': 'YES'}}
+    assert uc2(nested_data())[1] == {"data": {'Yes': 'YES'}}
     assert uc2((0, d))[1] is d
 
 
 def test_update_context_update_str():
     # string initialization of update works
     # if value is True, the value is copied.
-    data = (0, {"data": {"yes": {"Yes": "YES"}}})
     uc1 = UpdateContext("data.yes.Yes", "{{data.yes}}", recursively=False, value=True)
-    assert uc1(copy.deepcopy(data)) == (
+    assert uc1(nested_data()) == (
         0,
         {
             "data": {
@@ -125,7 +141,7 @@ def test_update_context_update_str():
 
     # subdictionaries are converted to string if value is False
     uc2 = UpdateContext("data.yes.Yes", "{{data.yes}}", recursively=False, value=False)
-    assert uc2(copy.deepcopy(data)) == (
+    assert uc2(nested_data()) == (
         0,
         {
             "data": {
@@ -135,7 +151,7 @@ def test_update_context_update_str():
     )
 
     # value missing in data
-    with pytest.raises(lena.core.LenaKeyError):
+    with pytest.raises(LenaKeyError):
         uc1((0, {}))
 
     # value is missing, default is set
@@ -156,10 +172,14 @@ def test_update_context_update_str():
     # a string
     uc32 = UpdateContext("data", "{{data.yes|default('x')}}", recursively=False)
     assert uc32((0, {})) == (0, {"data": "x"})
+    # templates are compiled once
+    assert uc32 == UpdateContext(
+        "data", "{{data.yes|default('x')}}", recursively=False
+    )
 
     # strings without braces are treated as simple update values
     uc4 = UpdateContext("data.yes.Yes", "data.yes", recursively=False)
-    assert uc4(copy.deepcopy(data)) == (
+    assert uc4(nested_data()) == (
         0,
         {
             "data": {
@@ -169,28 +189,28 @@ def test_update_context_update_str():
     )
 
     # braces can be only in the beginning and in the end of the string
-    with pytest.raises(lena.core.LenaValueError):
+    with pytest.raises(LenaValueError):
         UpdateContext("data", "{{data.yes")
-    with pytest.raises(lena.core.LenaValueError):
+    with pytest.raises(LenaValueError):
         UpdateContext("data", "{{{{data.yes}}")
-    with pytest.raises(lena.core.LenaValueError):
+    with pytest.raises(LenaValueError):
         UpdateContext("data", "{{{data.yes}}")
     # }} don't raise.
-    # with pytest.raises(lena.core.LenaValueError):
+    # with pytest.raises(LenaValueError):
     #     UpdateContext("data", "data.yes}}")
-    # with pytest.raises(lena.core.LenaValueError):
+    # with pytest.raises(LenaValueError):
     #     UpdateContext("data", "data.ye}}s")
-    # with pytest.raises(lena.core.LenaValueError):
+    # with pytest.raises(LenaValueError):
     #     UpdateContext("data", "{data.ye}}s}")
 
 
 def test_update_context_exception_strings():
     # test exception strings
     uc = UpdateContext("var", "{{data}}", raise_on_missing=True)
-    with pytest.raises(lena.core.LenaKeyError, match="'data' is undefined, context={}"):
+    with pytest.raises(LenaKeyError, match="'data' is undefined, context={}"):
         uc((None, {}))
     with pytest.raises(
-        lena.core.LenaValueError,
+        LenaValueError,
         match="fix braces for template string '{{{data}}' or set value to False"
         ):
         UpdateContext("var", "{{{data}}", value=True)
@@ -1,5 +1,4 @@
 import pytest
-from itertools import islice
 
 from lena.core import Sequence, Source
 from lena.core import LenaTypeError, LenaValueError, LenaNotImplementedError
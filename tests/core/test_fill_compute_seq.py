@@ -6,18 +6,12 @@ from lena.core import is_fill_compute_seq
 from lena.flow import Print
 from lena.flow import Slice
 from lena.math import Mean
+from tests.shortcuts import cnt1
 
 
 mul2 = lambda val: 2 * val
 
 
-def cnt1(): 
-    i = 1
-    while True:
-        yield i
-        i = i + 1
-
-
 def test_fill_compute_seq():
     # wrong initialization
     # no FillCompute element
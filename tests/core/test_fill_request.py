@@ -6,9 +6,10 @@ from lena.core import LenaTypeError, LenaValueError, LenaNotImplementedError
 from lena.core import (
     Call, FillInto, FillCompute, FillRequest, SourceEl, Run
 )
-from lena.flow import Slice, CountFrom, Print, StoreFilled
+from lena.flow import Slice, Print, StoreFilled
 from lena.math import Sum
 from tests.examples.numeric import Add
+from tests.shortcuts import ones
 
 
 # todo: check properties that
@@ -19,8 +20,6 @@ from tests.examples.numeric import Add
 
 # don't understand
 def _test_fill_request_run():
-    from itertools import islice, count
-
     size = 10
     data = list(range(size+1))
     bufsize = 5
@@ -45,56 +44,37 @@ def _test_fill_request_run():
     assert list(fry.run(iter(data))) == results
 
 
-def test_fill_request():
-    # todo: modify Source to use iterables (incl. those from itertools)
-    # from itertools import repeat
-    def ones():
-        while True:
-            yield 1
-
-    ## reset works
-    # reset=False works
-    s0 = Source(ones, Slice(10),
-                FillRequest(Sum(), reset=False, bufsize=1, buffer_input=True))
-    assert list(s0()) == list(range(1, 11))
-    # buffer_output works the same
-    s0o = Source(ones, Slice(10),
-                FillRequest(Sum(), reset=False, bufsize=1, buffer_output=True))
-    assert list(s0o()) == list(range(1, 11))
-
-    # reset=True works
-    s10 = Source(ones, Slice(10),
-                 FillRequest(Sum(), reset=True, bufsize=1, buffer_input=True))
-    assert list(s10()) == [1 for _ in range(10)]
-    # buffer_output works the same
-    s10o = Source(ones, Slice(10),
-                 FillRequest(Sum(), reset=True, bufsize=1, buffer_output=True))
-    assert list(s10o()) == [1 for _ in range(10)]
+@pytest.mark.parametrize("buffer", ["buffer_input", "buffer_output"])
+@pytest.mark.parametrize("reset, expected", [
+    (False, list(range(1, 11))),
+    (True, [1 for _ in range(10)]),
+])
+def test_fill_request_reset(buffer, reset, expected):
+    # reset works the same for buffer_input and buffer_output
+    fr = FillRequest(Sum(), reset=reset, bufsize=1, **{buffer: True})
+    assert list(Source(ones, Slice(10), fr)()) == expected
+
 
+def test_fill_request_slice_after():
     # Slice can be moved after FR if bufsize=1
-    s11 = Source(ones,
-                 FillRequest(Sum(), reset=True, bufsize=1, buffer_input=True),
-                 Slice(10))
-    assert list(s11()) == [1 for _ in range(10)]
-
-    # bufsize 10
-    s1 = Source(CountFrom(), Slice(100),
-                FillRequest(Sum(), reset=False, bufsize=10, buffer_input=True))
-    results = list(s1())
-    assert results == [45, 190, 435, 780, 1225, 1770, 2415, 3160, 4005, 4950]
-
-    # bufsize 1
-    s2 = Source(CountFrom(), Slice(10),
-                FillRequest(Sum(), reset=False, bufsize=1, buffer_input=True))
-    results = list(s2())
-    assert results == [0, 1, 3, 6, 10, 15, 21, 28, 36, 45]
+    fr = FillRequest(Sum(), reset=True, bufsize=1, buffer_input=True)
+    assert list(Source(ones, fr, Slice(10))()) == [1 for _ in range(10)]
 
+
+# CountFrom and Slice are tested separately,
+# here a range is enough.
+@pytest.mark.parametrize("size, bufsize, reset, expected", [
+    (100, 10, False, [45, 190, 435, 780, 1225, 1770, 2415, 3160, 4005, 4950]),
+    (10, 1, False, [0, 1, 3, 6, 10, 15, 21, 28, 36, 45]),
     # derive from FillCompute
-    s3 = Source(CountFrom(), Slice(10),
-                FillRequest(Sum(), bufsize=1., reset=True, buffer_input=True))
-    results = list(s3())
-    assert results == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    (10, 1., True, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
+])
+def test_fill_request_bufsize(size, bufsize, reset, expected):
+    fr = FillRequest(Sum(), bufsize=bufsize, reset=reset, buffer_input=True)
+    assert list(Source(lambda: range(size), fr)()) == expected
+
 
+def test_fill_request():
     # run works correctly
     class MyRun():
 
@@ -129,10 +109,21 @@ def test_fill_request():
     assert list(fr.run([])) == []
 
 
+@pytest.mark.parametrize("reset, results", [
+    (True, [1, 2, 3]), (False, [1, 3, 6])
+])
+def test_fill_request_buffer_output(reset, results):
+    # results are buffered during fill in the order of filling
+    fr = FillRequest(Sum(), reset=reset, bufsize=1, buffer_output=True)
+    for val in [1, 2, 3]:
+        fr.fill(val)
+    assert list(fr.request()) == results
+    # the buffer is emptied after request
+    assert list(fr.request()) == []
+
+
 # don't understand how it works
 def _test_yield_on_remainder():
-    from itertools import islice, count
-
     size = 3
     data = list(range(size))
     bufsize = 2
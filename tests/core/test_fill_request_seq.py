@@ -5,24 +5,11 @@ from lena.core import LenaNotImplementedError, LenaTypeError
 from lena.flow import Print
 from lena.flow import Slice, CountFrom
 from lena.math import Mean, Sum
+from tests.shortcuts import cnt1, ones
 
 
-# it seems I can't replace cnt1 with CountFrom,
-# because that is not iterable. todo: reconsider Source.
-def cnt1():
-    i = 1
-    while True:
-        yield i
-        i = i + 1
-
-
-def ones():
-    while True:
-        yield 1
-
-
-def test_fill_request_seq():
-    s1 = Source(
+def sum_ones():
+    return Source(
         ones,
         FillRequestSeq(
             FillRequest(Sum(), reset=False, buffer_input=True),
@@ -32,15 +19,13 @@ def test_fill_request_seq():
         ),
         Slice(10)
     )
-    assert list(s1()) == list(range(1, 11))
 
 
-def test_fill_request_seq_old():
-    # FillRequest with preprocess works
+def sum_with_preprocess():
     # how not to write tests. Unclear what the result should be.
     # But I remember that I carefully checked that when written.
     # yes, really 3 reset=False, because 3 explicit FillRequests.
-    s1 = Source(
+    return Source(
         cnt1,
         # this FillRequest is optional
         FillRequest(
@@ -55,10 +40,10 @@ def test_fill_request_seq_old():
         ),
         Slice(10)
     )
-    assert list(s1()) == [0, 1, 3, 6, 10, 15, 21, 28, 36, 45]
 
-    # FR with postprocess works
-    s2 = Source(
+
+def sum_with_postprocess():
+    return Source(
         cnt1,
         FillRequestSeq(
             FillRequest(Sum(), reset=False, buffer_input=True),
@@ -67,8 +52,21 @@ def test_fill_request_seq_old():
         ),
         Slice(10)
     )
-    assert list(s2()) == [0, 2, 5, 9, 14, 20, 27, 35, 44, 54]
 
+
+@pytest.mark.parametrize("make_source, expected", [
+    (sum_ones, list(range(1, 11))),
+    # FillRequest with preprocess works
+    (sum_with_preprocess, [0, 1, 3, 6, 10, 15, 21, 28, 36, 45]),
+    # FR with postprocess works
+    (sum_with_postprocess, [0, 2, 5, 9, 14, 20, 27, 35, 44, 54]),
+])
+def test_fill_request_seq_source(make_source, expected):
+    # elements keep their state, so they are created for each case
+    assert list(make_source()()) == expected
+
+
+def test_fill_request_seq_old():
     # bufsize initialization works
     frs = FillRequestSeq(
         FillRequest(Sum(), reset=True, buffer_input=True),
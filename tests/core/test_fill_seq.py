@@ -56,3 +56,19 @@ def test_fill():
     # assert store == [4]
     # with pytest.raises(lena.core.LenaTypeError):
     #     s = FillSeq(5, store)
+
+
+def test_fill_seq_mixed_fill_into():
+    # callables and explicit FillInto elements are chained in order
+    store = StoreFilled()
+    s = FillSeq(Add(1), FillInto(lambda val: val * 10), Add(-1), store)
+    s.fill(1)
+    s.fill(2)
+    assert store.group == [19, 29]
+
+    # fill of the last element can be changed after initialization
+    store2 = StoreFilled()
+    s2 = FillSeq(lambda val: val * 10, store2)
+    store2.fill = store.fill
+    s2.fill(3)
+    assert store.group == [19, 29, 30] and store2.group == []
@@ -20,6 +20,14 @@ def test_repr_sequence():
     # print(s03)
     assert repr(s03) == "Sequence(\n    Sequence(\n        Sequence()\n    )\n)"
 
+    # representation follows the state of elements
+    count = Count()
+    s04 = Sequence(count)
+    assert repr(s04) == "Sequence(\n    {}\n)".format(repr(count))
+    list(s04.run([0]))
+    assert repr(s04) == "Sequence(\n    {}\n)".format(repr(count))
+    assert "count=1" in repr(s04)
+
 
 def test_repr_source():
     # not Lena elements can also be represented
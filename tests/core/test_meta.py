@@ -0,0 +1,22 @@
+from lena.core import Sequence, Source, flatten
+from lena.flow import Count, Print, Slice
+
+from tests.shortcuts import cnt0
+
+
+def test_flatten():
+    # elements are returned unchanged
+    count = Count()
+    assert flatten(count) is count
+
+    # flat sequences are returned unchanged
+    seq0 = Sequence(Count(), Print())
+    assert flatten(seq0) is seq0
+
+    # nested sequences are flattened in order
+    print_ = Print()
+    seq1 = Sequence(count, Sequence(print_))
+    assert flatten(seq1) == [count, print_]
+    src = Source(cnt0, Sequence(Sequence(Slice(1)), count), print_)
+    assert flatten(src) == [cnt0, Slice(1), count, print_]
+    assert flatten(Sequence(Sequence(), Sequence(Sequence()))) == []
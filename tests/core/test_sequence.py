@@ -75,6 +75,25 @@ def test_sequence():
     # setting elements is prohibited
     with pytest.raises(TypeError):
         seq2[0] = 0
+    # sequences have no instance dictionary
+    with pytest.raises(AttributeError):
+        seq2.unknown_attribute = 0
+
+
+def test_sequence_identity():
+    id_ = lambda val: val
+    seq = Sequence(id_, lambda val: val + 1, id_)
+    # identity functions are not run
+    assert len(seq._data_seq) == 1
+    # but remain in the sequence
+    assert len(seq) == 3
+    assert list(seq.run([1, 2])) == [2, 3]
+    assert list(Sequence(id_).run([1, 2])) == [1, 2]
+
+    # other functions are run
+    def first(*args):
+        return args[0]
+    assert len(Sequence(first)._data_seq) == 1
 
 
 def printsseq(sseq):
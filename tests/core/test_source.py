@@ -1,8 +1,8 @@
 import pytest
 from itertools import islice
 
-import lena.core
 from lena.core import Source, Sequence
+from lena.core import LenaTypeError, LenaValueError
 from lena.flow import Slice, CountFrom
 
 from tests.shortcuts import cnt0
@@ -12,6 +12,9 @@ def test_source():
     it5 = Slice(5)
     sseq = Source(cnt0, it5)
     assert list(sseq()) == [0, 1, 2, 3, 4]
+    # a trailing Slice yields directly from itertools.islice,
+    # without a Python frame per value
+    assert isinstance(sseq(), islice)
 
     ## Test special double underscore methods, emulating a container.
     # can create a list from that
@@ -29,9 +32,9 @@ def test_source():
         seq2[0] = 0
 
     # empty and wrong arguments raise proper errors
-    with pytest.raises(lena.core.LenaTypeError):
+    with pytest.raises(LenaTypeError):
         s = Source()
-    with pytest.raises(lena.core.LenaTypeError):
+    with pytest.raises(LenaTypeError):
         s = Source(1)
 
     # can initialize from iterable
@@ -43,3 +46,33 @@ def test_source():
         # This really looks like an error.
         # What would that sequence do anyway.
         Source((cnt0, Slice(1)))
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4])
+def test_source_prefetch(prefetch):
+    # results are same with and without prefetch
+    sseq = Source(cnt0, Slice(5), prefetch=prefetch)
+    assert list(sseq()) == [0, 1, 2, 3, 4]
+    # a finite flow works
+    src = Source([1, 2, 3], lambda val: val+1, prefetch=prefetch)
+    assert list(src()) == [2, 3, 4]
+
+    # errors in the flow are raised
+    for error in [ValueError, SystemExit]:
+        def raise_after_one():
+            yield 1
+            raise error("flow error")
+        with pytest.raises(error, match="flow error"):
+            list(Source(raise_after_one, lambda val: val,
+                        prefetch=prefetch)())
+
+
+def test_source_prefetch_init():
+    with pytest.raises(LenaValueError):
+        Source(cnt0, prefetch=-1)
+    for prefetch in [1.5, 2., "2", None, True]:
+        with pytest.raises(LenaTypeError):
+            Source(cnt0, prefetch=prefetch)
+    with pytest.raises(LenaTypeError):
+        Source(cnt0, unknown=1)
+    assert Source(cnt0, prefetch=2) != Source(cnt0)
@@ -1,5 +1,4 @@
 import copy
-import os
 
 import pytest
 
@@ -18,7 +17,6 @@ from tests.example_sequences import (ASCIILowercase, ASCIIUppercase,
 # from tests.examples.fill_compute import Count
 from lena.math import Sum
 from lena.flow import Count
-from tests.core.test_fill_compute_seq import cnt1
 
 
 class StopFill():
@@ -89,8 +87,32 @@ def test_split_buffer():
     assert "".join(s()) == "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 
 
-def test_split_sequence_with_cache(tmpdir):
-    os.chdir(str(tmpdir))
+def test_split_copy_buf():
+    def set_detector(val):
+        val[1]["data"]["detector"] = "far"
+        return val
+
+    flow = [(0, {"data": {}}), (1, {"data": {}})]
+    # a sequence changing values doesn't affect the following ones
+    s = Split([set_detector, id_])
+    assert list(s.run(flow)) == [
+        (0, {"data": {"detector": "far"}}), (1, {"data": {"detector": "far"}}),
+        (0, {"data": {}}), (1, {"data": {}}),
+    ]
+    # the last sequence gets the original values
+    assert flow == [(0, {"data": {}}), (1, {"data": {}})]
+
+    # shared references and cycles are copied as with deepcopy
+    shared = [1]
+    cyclic = []
+    cyclic.append(cyclic)
+    res = list(Split([id_, id_]).run([(shared, shared), cyclic]))
+    assert res[0][0] is res[0][1] and res[0][0] is not shared
+    assert res[1][0] is res[1] and res[1] is not cyclic
+
+
+def test_split_sequence_with_cache(tmpdir, monkeypatch):
+    monkeypatch.chdir(str(tmpdir))
     s = Source(ascii_lowercase, Split([lambda s: s.upper(), lowercase_cached_seq]))
     # print(list(Cache(lowercase_cached_filename)._load_flow()))
     # print(Call(Cache(lowercase_cached_filename), call="_load_flow")())
@@ -124,7 +146,8 @@ def test_split_with_fill_computes():
     orig_context = copy.deepcopy(context)
     counter_context = {'type': 'extended histogram', 'count': 6}
     # otherwise context is updated by the last sequence.
-    flowc = [(val, copy.deepcopy(context)) for val in flow]
+    # context is flat, so a shallow copy suffices
+    flowc = [(val, dict(context)) for val in flow]
     seq_res = list(seq.run(flowc))
     assert seq_res == [(10, orig_context), (6, counter_context)]
 
@@ -185,6 +208,35 @@ def test_split_with_fill_request():
     # assert res4 == [1]
 
 
+@pytest.mark.parametrize("bufsize", [1, 3, 1000])
+def test_split_parallel(bufsize):
+    def make_split(parallel):
+        return Split([
+            (StopFill(4), Sum()),
+            lambda val: val * 10,
+            FillRequest(Sum(), reset=False, buffer_input=True),
+            Count(),
+        ], bufsize=bufsize, parallel=parallel)
+
+    flow = list(range(10))
+    # results and their order are same as without threads
+    assert (list(make_split(True).run(iter(flow)))
+            == list(make_split(False).run(iter(flow))))
+
+
+@pytest.mark.parametrize("error", [ValueError, SystemExit])
+def test_split_parallel_error(error):
+    # a failing thread produces no partial results
+    def raise_error(val):
+        raise error("fill error")
+    split = Split([(raise_error, Sum()), Count()], parallel=True)
+    results = []
+    with pytest.raises(error, match="fill error"):
+        for val in split.run(iter(range(5))):
+            results.append(val)
+    assert results == []
+
+
 def test_repr():
     s01 = Split([])
     assert repr(s01) == "Split([])"
@@ -105,6 +105,16 @@ def test_set_context_split():
     # the resulting context is intersection of the inner contexts.
     assert store5.context == {'data': {'lost': True}}
 
+    # the context is returned as a copy
+    split._get_context()['data']['lost'] = False
+    assert split._get_context() == {'data': {'lost': True}}
+
+    # the context of Split is updated with the external one
+    split2 = Split([(call,), (call, set_context_near)])
+    assert split2._get_context() == {}
+    Source(SetContext("data.cycle", 1), call, split2)
+    assert split2._get_context() == {'data': {'cycle': 1}}
+
 
 def test_set_formatted_context():
     # this function tests at large, but is still useful.
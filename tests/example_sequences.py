@@ -7,14 +7,12 @@ from lena.flow import Cache
 class ASCIILowercase(object):
     """abcdefghijklmnopqrstuvwxyz"""
     def __call__(self):
-        for s in string.ascii_lowercase:
-            yield s
+        return iter(string.ascii_lowercase)
 
 
 class ASCIIUppercase(object):
     def __call__(self):
-        for s in string.ascii_uppercase:
-            yield s
+        return iter(string.ascii_uppercase)
 
 
 ascii_lowercase = Source(ASCIILowercase())
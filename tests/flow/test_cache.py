@@ -1,4 +1,4 @@
-import os
+import pickle
 
 import pytest
 
@@ -14,9 +14,9 @@ from tests.example_sequences import (
 from tests.shortcuts import cnt1, cnt1c
 
 
-def test_cache(tmpdir):
+def test_cache(tmpdir, monkeypatch):
     low_letters = "abcdefghijklmnopqrstuvwxyz"
-    os.chdir(str(tmpdir))
+    monkeypatch.chdir(str(tmpdir))
 
     # empty cache makes no problems
     s1 = Source(ascii_lowercase, lowercase_cached_seq)
@@ -82,9 +82,29 @@ def test_cache_2(tmp_path):
     res4 = [result for result in s4c()]
     assert res4 == [(1, {'1': 1}), (2, {'2': 2})]
 
-
-def test_alter_sequence(tmpdir):
-    os.chdir(str(tmpdir))
+    # values are loaded independently from each other
+    cache_d = str(tmp_path / "cache_d")
+    data = [{"a": [1]}, {"a": [1]}, ({"b": 2}, {"b": 2})]
+    s5 = Source(lambda: iter(data), Cache(cache_d))
+    assert list(s5()) == data
+    res5 = list(s5())
+    assert res5 == data
+    assert res5[0]["a"] is not res5[1]["a"]
+
+    # shared references within a value don't refer to other values
+    cache_e = str(tmp_path / "cache_e")
+    shared = [1]
+    data = [{"k": "v"}, (shared, shared)]
+    s6 = Source(lambda: iter(data),
+                Cache(cache_e, protocol=pickle.HIGHEST_PROTOCOL))
+    assert list(s6()) == data
+    res6 = list(s6())
+    assert res6 == data
+    assert res6[1][0] is res6[1][1]
+
+
+def test_alter_sequence(tmpdir, monkeypatch):
+    monkeypatch.chdir(str(tmpdir))
     cached_to_source = Cache.alter_sequence
 
     lowercase_cache_el = Cache(lowercase_cached_filename)
@@ -36,6 +36,37 @@ def test_count(initial_count):
     assert len(results) == 4
     assert results[3] == ("foo", {'counter': 4})
 
+    # context is taken only from (data, context) pairs
+    c3 = Count("counter")
+    c3.fill((1, {"data": 1}))
+    assert list(c3.compute()) == [(1, {"data": 1, "counter": 1})]
+    c3.fill((1, 2))
+    assert list(c3.compute()) == [(2, {"counter": 2})]
+
+
+@pytest.mark.parametrize("typecode", [None, "d"])
+def test_store_filled(typecode):
+    store = StoreFilled(typecode=typecode)
+    for val in [1, 2.5]:
+        store.fill(val)
+    results = list(store.compute())
+    assert len(results) == 1
+    assert list(results[0]) == [1, 2.5]
+    # results don't change after fill
+    store.fill(3)
+    assert list(results[0]) == [1, 2.5]
+    store.reset()
+    assert list(store.group) == []
+    assert store.group.__class__ == results[0].__class__
+
+
+def test_store_filled_typecode():
+    store = StoreFilled(typecode="l")
+    with pytest.raises(TypeError):
+        store.fill(1.5)
+    with pytest.raises(lena.core.LenaValueError):
+        StoreFilled(typecode="unknown")
+
 
 def test_count_eq_repr():
     # empty counter
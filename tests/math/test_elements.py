@@ -163,6 +163,12 @@ def test_sum():
     s1.fill(2)
     assert s1.total == 3
 
+    # tuples that are not (data, context) pairs are summed as data
+    s2 = Sum(())
+    s2.fill((1, 2))
+    s2.fill((3,))
+    assert list(s2.compute()) == [(1, 2, 3)]
+
 
 @pytest.mark.parametrize("stype", [Sum, DSum])
 @given(st.lists(integers()))
@@ -4,7 +4,7 @@ pytestmark = pytest.mark.root
 import ROOT
 
 import lena
-from lena.core import LenaKeyError, LenaTypeError
+from lena.core import LenaKeyError, LenaTypeError, LenaValueError
 from lena.input import ReadROOTFile
 
 
@@ -63,3 +63,33 @@ def test_read_root_file(rootfile):
     # not string keys raise
     with pytest.raises(LenaTypeError):
         ReadROOTFile((0,))
+
+
+def test_read_root_file_chain(rootfile):
+    data = [rootfile, (rootfile, {"input": {"sample": 1}})]
+
+    # single trees are read
+    nentries = 0
+    for tree, _ in ReadROOTFile("tree").run([rootfile]):
+        nentries += tree.GetEntries()
+
+    # trees from several files are chained
+    read_chain = ReadROOTFile("tree", chain=True)
+    for ind, val in enumerate(read_chain.run(data)):
+        dt, context = val
+        assert dt.GetName() == "tree"
+        assert dt.GetEntries() == 2 * nentries
+        assert context == {
+            "input": {
+                "root_file_key": "tree",
+                "root_file_path": [rootfile, rootfile],
+            }
+        }
+    assert ind == 0
+
+    # empty flow yields nothing
+    assert list(read_chain.run([])) == []
+
+    # keys must be set for a chain
+    with pytest.raises(LenaValueError):
+        ReadROOTFile(chain=True)
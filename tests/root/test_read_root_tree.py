@@ -21,6 +21,7 @@ def test_read_root_tree(rootfile):
     # ReadROOTTree runs.
     read_tree = ReadROOTTree(leaves=["x", "y"])
     tree_data = []
+    contexts = []
     for val in read_tree.run(data):
         data, context = val
         tree_data.append((data.x, data.y))
@@ -29,4 +30,8 @@ def test_read_root_tree(rootfile):
                 'root_tree_name': 'tree'
             }
         }
+        contexts.append(context)
     assert tree_data == test_data
+    # contexts of entries are independent
+    contexts[0]["input"]["root_tree_name"] = "changed"
+    assert contexts[1]["input"]["root_tree_name"] == "tree"
@@ -1,8 +1,10 @@
+# Infinite sources are C iterators from itertools,
+# which are faster than Python generators.
+import itertools
+
+
 def cnt1():
-    i = 0
-    while True:
-        i += 1
-        yield i
+    return itertools.count(1)
 
 
 def cnt1c():
@@ -12,8 +14,10 @@ def cnt1c():
         yield (i, {str(i): i})
 
 
-def cnt0(): 
-    i = 0
-    while True:
-        yield i
-        i = i + 1
+def ones():
+    # todo: modify Source to use iterables (incl. those from itertools)
+    return itertools.repeat(1)
+
+
+def cnt0():
+    return itertools.count()
@@ -1,4 +1,5 @@
 import copy
+import sys
 import pytest
 from copy import deepcopy
 
@@ -7,6 +8,7 @@ import lena.context
 from lena.core import LenaTypeError, Sequence
 from lena.flow import get_data
 from lena.variables.variable import Combine, Compose, Variable
+from lena.variables.variable import _simplify_getter
 
 
 # "double events"
@@ -293,6 +295,13 @@ def test_variable():
             'variable': sq_m.var_context}
     )
 
+    # contexts of different values are independent
+    res1 = mm(1)
+    res2 = mm(2)
+    res1[1]["variable"]["length"]["unit"] = "cm"
+    assert res2[1]["variable"]["length"]["unit"] == "mm"
+    assert mm.var_context["length"]["unit"] == "mm"
+
 
 def test_getattr_and_var_context():
     x_mm = Variable("x", unit="mm", getter=lambda x: x*10, type="coordinate")
@@ -319,3 +328,40 @@ def test_getattr_and_var_context():
     compose = Compose(x_mm, y_mm, name="xy", type="coordinate")
     assert compose.type == "coordinate"
     assert "getter" not in compose.var_context
+
+
+def test_simplify_getter():
+    import operator
+
+    class Data(object):
+        x = 3
+
+    # trivial lambdas are replaced
+    getter = _simplify_getter(lambda coord: coord[1])
+    assert isinstance(getter, operator.itemgetter)
+    assert getter((1, 2)) == 2
+    getter = _simplify_getter(lambda d: d["x"])
+    assert isinstance(getter, operator.itemgetter)
+    assert getter({"x": 4}) == 4
+    getter = _simplify_getter(lambda d: d.x)
+    assert isinstance(getter, operator.attrgetter)
+    assert getter(Data()) == 3
+    x = Variable("x", lambda coord: coord[0])
+    assert isinstance(x.getter, operator.itemgetter)
+    assert x((5, 6)) == (5, {"variable": {"name": "x"}})
+
+    # other functions are not changed
+    ind = 1
+    funcs = [
+        lambda coord: coord[ind], lambda coord: coord[0] * 10,
+        lambda coord, ind=1: coord[ind], lambda coord: ind[0],
+        lambda coord: coord.x.y, abs,
+    ]
+    for func in funcs:
+        assert _simplify_getter(func) is func
+
+    if sys.version_info.major >= 3:
+        # keyword-only arguments are required for the call.
+        # eval, because this is a syntax error in Python 2
+        func = eval("lambda coord, *, ind: coord[0]")
+        assert _simplify_getter(func) is func